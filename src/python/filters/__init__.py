@@ -7,7 +7,7 @@ _filter_registry: Dict[str, Type[FilterBase]] = {}
 
 
 def register_filter(filter_type: str, filter_class: Type[FilterBase]) -> None:
-    """Register a filter class."""
+    """Register a filter class by type."""
     _filter_registry[filter_type] = filter_class
 
 
@@ -16,6 +16,14 @@ def get_filter(filter_type: str) -> Type[FilterBase] | None:
     return _filter_registry.get(filter_type)
 
 
+def get_display_name(filter_type: str) -> str | None:
+    """Get a filter's display name without instantiating it."""
+    filter_class = _filter_registry.get(filter_type)
+    if filter_class is None:
+        return None
+    return filter_class.DISPLAY_NAME or filter_type
+
+
 def get_all_filter_types() -> list[str]:
     """Get all registered filter types."""
     return list(_filter_registry.keys())
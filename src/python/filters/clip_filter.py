@@ -5,6 +5,7 @@ from PySide6.QtCore import Signal
 from filters.filter_base import FilterBase
 from models.pipeline_item import PipelineItem
 from views.common_widgets import ScientificDoubleSpinBox
+import vtk
 from utils.logger import get_logger, log_execution
 from utils.tool_registry import expose_tool
 from utils.app_context import get_pipeline_viewmodel
@@ -39,6 +40,8 @@ class ClipParams:
 class ClipFilter(FilterBase):
     """Clip filter implementation - example of how easy it is to add a new filter."""
     
+    DISPLAY_NAME = "Clip"
+    
     @property
     def apply_immediately(self) -> bool:
         return False
@@ -47,10 +50,6 @@ class ClipFilter(FilterBase):
     def filter_type(self) -> str:
         return "clip_filter"
     
-    @property
-    def display_name(self) -> str:
-        return "Clip"
-    
     @property
     def params_class(self) -> type:
         return ClipParams
@@ -58,7 +57,6 @@ class ClipFilter(FilterBase):
     @log_execution(start_msg="Clip Filter Calculation Started", end_msg="Clip Filter Calculation Finished")
     def apply_filter(self, data: Any, params: dict) -> Tuple[Any, Any]:
         """Apply clip filter."""
-        import vtk
         clip_params = ClipParams.from_dict(params)
         
         plane = vtk.vtkPlane()
@@ -243,7 +241,7 @@ class ClipFilter(FilterBase):
         if not target_item:
             return f"Error: Item {target_id} not found"
             
-        center = target_item.vtk_data.GetCenter() if target_item.vtk_data else (0.0, 0.0, 0.0)
+        center = target_item.center or (0.0, 0.0, 0.0)
         origin = [
             origin_x if origin_x is not None else center[0],
             origin_y if origin_y is not None else center[1],
@@ -256,9 +254,11 @@ class ClipFilter(FilterBase):
             "show_preview": show_plane
         }
         
-        result = vm.apply_filter("clip_filter", target_id, params)
+        with vm.bulk_changes():
+            result = vm.apply_filter("clip_filter", target_id, params)
+            if result:
+                vm.commit_filter(result.id)
         if result:
-            vm.commit_filter(result.id)
             return f"Applied clip filter to '{target_item.name}'. New item: '{result.name}' (id: {result.id})"
         return "Error: Failed to apply clip filter"
 
@@ -317,9 +317,11 @@ class ClipFilter(FilterBase):
         if not updated:
             return "No parameters changed."
             
-        vm.update_filter_params(target_id, params)
+        with vm.bulk_changes():
+            vm.update_filter_params(target_id, params)
+            if apply:
+                vm.commit_filter(target_id)
         if apply:
-            vm.commit_filter(target_id)
             return f"Updated and applied clip filter: {', '.join(updated)}"
         return f"Updated parameters (not applied): {', '.join(updated)}"
 
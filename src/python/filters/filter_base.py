@@ -13,6 +13,8 @@ logger = get_logger("FilterBase")
 class FilterBase(ABC):
     """Base class for all filters."""
     
+    DISPLAY_NAME = ""  # Name shown in menus and messages (e.g., 'Slice'); read without instantiating
+    
     def __init__(self, render_service: VTKRenderService):
         self._render_service = render_service
     
@@ -34,10 +36,9 @@ class FilterBase(ABC):
         return None
     
     @property
-    @abstractmethod
     def display_name(self) -> str:
         """Return the display name for the filter (e.g., 'Slice')."""
-        pass
+        return self.DISPLAY_NAME
     
     @abstractmethod
     def apply_filter(self, data: Any, params: dict) -> Tuple[Any, Any]:
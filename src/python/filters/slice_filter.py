@@ -49,6 +49,8 @@ class SliceParams:
 class SliceFilter(FilterBase):
     """Slice filter implementation."""
     
+    DISPLAY_NAME = "Slice"
+    
     def __init__(self, render_service):
         super().__init__(render_service)
         self._params_widget: Optional[QWidget] = None
@@ -62,10 +64,6 @@ class SliceFilter(FilterBase):
     def filter_type(self) -> str:
         return "slice_filter"
     
-    @property
-    def display_name(self) -> str:
-        return "Slice"
-    
     @property
     def params_class(self) -> type:
         return SliceParams
@@ -207,31 +205,13 @@ class SliceFilter(FilterBase):
         
         self._offset_widget = OffsetListWidget()
         self._offset_widget.set_offsets(params.offsets)
-        
-        if parent_bounds:
-            normal_np = np.array(params.normal)
-            normal_len = np.linalg.norm(normal_np)
-            if normal_len > 0:
-                normal_np = normal_np / normal_len
-            
-            bounds = parent_bounds
-            corners = [
-                [bounds[0], bounds[2], bounds[4]],
-                [bounds[1], bounds[2], bounds[4]],
-                [bounds[0], bounds[3], bounds[4]],
-                [bounds[1], bounds[3], bounds[4]],
-                [bounds[0], bounds[2], bounds[5]],
-                [bounds[1], bounds[2], bounds[5]],
-                [bounds[0], bounds[3], bounds[5]],
-                [bounds[1], bounds[3], bounds[5]],
-            ]
-            origin_np = np.array(params.origin)
-            projections = [np.dot(np.array(c) - origin_np, normal_np) for c in corners]
-            min_proj = min(projections)
-            max_proj = max(projections)
-            self._offset_widget.set_value_range(min_proj, max_proj)
+        self._update_offset_range(params, parent_bounds)
         
         self._offset_widget.offsets_changed.connect(lambda offsets: self._on_offsets_changed(offsets, item))
+        self._offset_widget.refresh_requested.connect(
+            lambda: self._on_offset_range_refresh(item, parent_bounds),
+            Qt.ConnectionType.DirectConnection,
+        )
         main_layout.addWidget(self._offset_widget)
         
         layout.addWidget(group)
@@ -239,6 +219,40 @@ class SliceFilter(FilterBase):
         self._params_widget = widget
         return widget
     
+    def _update_offset_range(self, params: SliceParams, parent_bounds: Optional[Tuple[float, ...]]) -> None:
+        """Set the offset widget range to the extent of the input bounds along the slice normal."""
+        if not parent_bounds or not self._offset_widget:
+            return
+        
+        normal_np = np.array(params.normal)
+        normal_len = np.linalg.norm(normal_np)
+        if normal_len > 0:
+            normal_np = normal_np / normal_len
+        
+        bounds = parent_bounds
+        corners = [
+            [bounds[0], bounds[2], bounds[4]],
+            [bounds[1], bounds[2], bounds[4]],
+            [bounds[0], bounds[3], bounds[4]],
+            [bounds[1], bounds[3], bounds[4]],
+            [bounds[0], bounds[2], bounds[5]],
+            [bounds[1], bounds[2], bounds[5]],
+            [bounds[0], bounds[3], bounds[5]],
+            [bounds[1], bounds[3], bounds[5]],
+        ]
+        origin_np = np.array(params.origin)
+        projections = [np.dot(np.array(c) - origin_np, normal_np) for c in corners]
+        min_proj = min(projections)
+        max_proj = max(projections)
+        self._offset_widget.set_value_range(min_proj, max_proj)
+    
+    def _on_offset_range_refresh(self, item: Optional[PipelineItem],
+                                 parent_bounds: Optional[Tuple[float, ...]]) -> None:
+        """Recompute the offset range from the current origin and normal."""
+        if not item:
+            return
+        self._update_offset_range(SliceParams.from_dict(item.filter_params), parent_bounds)
+    
     def get_params_changed_signal(self, widget: QWidget) -> Optional[Signal]:
         """Get the offsets changed signal."""
         if self._offset_widget:
@@ -346,7 +360,7 @@ class SliceFilter(FilterBase):
         if not target_item:
             return f"Error: Item {target_id} not found"
             
-        center = target_item.vtk_data.GetCenter() if target_item.vtk_data else (0.0, 0.0, 0.0)
+        center = target_item.center or (0.0, 0.0, 0.0)
         origin = [
             origin_x if origin_x is not None else center[0],
             origin_y if origin_y is not None else center[1],
@@ -365,9 +379,11 @@ class SliceFilter(FilterBase):
             "show_preview": show_plane
         }
         
-        result = vm.apply_filter("slice_filter", target_id, params)
+        with vm.bulk_changes():
+            result = vm.apply_filter("slice_filter", target_id, params)
+            if result:
+                vm.commit_filter(result.id)
         if result:
-            vm.commit_filter(result.id)
             return f"Applied slice filter to '{target_item.name}'. New item: '{result.name}' (id: {result.id})"
         return "Error: Failed to apply slice filter"
 
@@ -434,9 +450,11 @@ class SliceFilter(FilterBase):
         if not updated:
             return "No parameters changed."
             
-        vm.update_filter_params(target_id, params)
+        with vm.bulk_changes():
+            vm.update_filter_params(target_id, params)
+            if apply:
+                vm.commit_filter(target_id)
         if apply:
-            vm.commit_filter(target_id)
             return f"Updated and applied slice filter: {', '.join(updated)}"
         return f"Updated parameters (not applied): {', '.join(updated)}"
 
@@ -1,21 +1,25 @@
 from dataclasses import dataclass, field
 from typing import Any, List, Optional, Tuple
+import sys
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorByInfo:
     """Information about current color by setting."""
     array_name: str = "__SolidColor__"
     array_type: str = "POINT"
     component: str = ""
     
+    def __post_init__(self):
+        self.array_type = sys.intern(self.array_type)
+    
     @property
     def is_solid_color(self) -> bool:
         return self.array_name == "__SolidColor__"
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineItem:
     """Represents a single item in the visualization pipeline."""
     
@@ -34,6 +38,46 @@ class PipelineItem:
     time_steps: List[Any] = field(default_factory=list)
     time_file_paths: List[str] = field(default_factory=list)
     current_time_index: int = 0
+    playback_lod: int = 0  # > 0 while animating: render a reduced version of the data
+    
+    is_filter: bool = field(init=False, repr=False, compare=False)
+    
+    # Memoized data statistics, valid while vtk_data is the same unmodified object
+    _stats_data: Any = field(default=None, init=False, repr=False, compare=False)
+    _stats_mtime: int = field(default=-1, init=False, repr=False, compare=False)
+    _stats: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.item_type = sys.intern(self.item_type)
+        self.is_filter = "filter" in self.item_type
+    
+    def _cached_stat(self, key: str, compute) -> Any:
+        """Return a memoized statistic of vtk_data, recomputing after data changes."""
+        data = self.vtk_data
+        if data is None:
+            return None
+        
+        mtime = data.GetMTime()
+        if data is not self._stats_data or mtime != self._stats_mtime:
+            self._stats_data = data
+            self._stats_mtime = mtime
+            self._stats.clear()
+        
+        if key not in self._stats:
+            self._stats[key] = compute(data)
+        return self._stats[key]
+    
+    @property
+    def bounds(self) -> Optional[Tuple[float, ...]]:
+        """Get data bounds (xmin, xmax, ymin, ymax, zmin, zmax)."""
+        return self._cached_stat("bounds", lambda data: data.GetBounds())
+    
+    @property
+    def center(self) -> Optional[Tuple[float, float, float]]:
+        """Get data center, or None if the data has no geometry."""
+        return self._cached_stat(
+            "center", lambda data: data.GetCenter() if hasattr(data, "GetCenter") else None
+        )
     
     @property
     def time_step_count(self) -> int:
@@ -63,6 +107,19 @@ class PipelineItem:
         self.vtk_data = self.time_steps[index]
         return True
     
+    def set_playback_lod(self, level: int) -> bool:
+        """
+        Set the level of detail used while the time series is playing.
+        
+        Returns:
+            True if the level changed, False otherwise
+        """
+        level = max(0, level)
+        if level == self.playback_lod:
+            return False
+        self.playback_lod = level
+        return True
+    
     def get_info_string(self) -> str:
         """Generate information string about this item."""
         lines = [f"Name: {self.name}", f"Type: {self.item_type}"]
@@ -77,7 +134,7 @@ class PipelineItem:
                 lines.append(f"Number of Points: {data.GetNumberOfPoints()}")
                 lines.append(f"Number of Cells: {data.GetNumberOfCells()}")
                 
-                bounds = data.GetBounds()
+                bounds = self.bounds
                 lines.append(f"Bounds: X[{bounds[0]:.4g}, {bounds[1]:.4g}] "
                            f"Y[{bounds[2]:.4g}, {bounds[3]:.4g}] "
                            f"Z[{bounds[4]:.4g}, {bounds[5]:.4g}]")
@@ -13,13 +13,22 @@ class PropertiesPanelContext:
     scalar_visible: bool = False
     
     @classmethod
-    def from_item(cls, item: Any, vtk_vm: Any) -> "PropertiesPanelContext":
-        """Create context from a pipeline item."""
+    def from_item(cls, item: Any, vtk_vm: Any,
+                  data_arrays: Optional[List[Tuple[str, str]]] = None) -> "PropertiesPanelContext":
+        """
+        Create context from a pipeline item.
+        
+        Args:
+            item: Pipeline item to describe
+            vtk_vm: VTK viewmodel used to query the actor and data
+            data_arrays: Precomputed data arrays of item.vtk_data; queried when None
+        """
         if not item or not item.actor:
             return cls()
         
         style = vtk_vm.get_representation_style(item.actor)
-        data_arrays = vtk_vm.get_data_arrays(item.vtk_data) if item.vtk_data else []
+        if data_arrays is None:
+            data_arrays = vtk_vm.get_data_arrays(item.vtk_data) if item.vtk_data else []
         
         current_array = None
         current_component = None
@@ -1,5 +1,6 @@
 from .vtk_render_service import VTKRenderService
 from .file_loader_service import FileLoaderService
+from .time_series_cache import TimeSeriesCache
 
-__all__ = ["VTKRenderService", "FileLoaderService"]
+__all__ = ["VTKRenderService", "FileLoaderService", "TimeSeriesCache"]
 
@@ -1,6 +1,7 @@
 import os
 import re
 import glob
+import functools
 import vtk
 from typing import Any, Tuple, List, Optional
 from utils.logger import get_logger, log_execution
@@ -66,6 +67,9 @@ class FileLoaderService:
         Looks for files with same base name but different trailing numbers.
         E.g., data_000.vtk, data_001.vtk, data_002.vtk
         
+        The directory scan is memoized on the directory's mtime, so loading
+        several files from the same folder only lists it once.
+        
         Args:
             file_path: Path to one of the series files
             
@@ -89,6 +93,16 @@ class FileLoaderService:
         base_name = name[:match.start()]
         num_digits = len(number_str)
         
+        dir_mtime = os.stat(directory or os.curdir).st_mtime_ns
+        series_files = self._find_series_files(directory, dir_mtime, base_name, num_digits, ext)
+        return list(series_files) if series_files else None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _find_series_files(directory: str, dir_mtime: int, base_name: str,
+                           num_digits: int, ext: str) -> Tuple[str, ...]:
+        """Scan a directory for series files (dir_mtime only keys the cache)."""
+        number_pattern = re.compile(r'(\d+)$')
         glob_pattern = os.path.join(directory, f"{base_name}*{ext}")
         candidate_files = glob.glob(glob_pattern)
         
@@ -101,7 +115,7 @@ class FileLoaderService:
                 series_files.append(candidate)
         
         if len(series_files) <= 1:
-            return None
+            return ()
         
         def extract_number(path):
             name = os.path.splitext(os.path.basename(path))[0]
@@ -109,7 +123,7 @@ class FileLoaderService:
             return int(m.group(1)) if m else 0
         
         series_files.sort(key=extract_number)
-        return series_files
+        return tuple(series_files)
     
     def _natural_sort_key(self, path: str):
         """Generate sort key for natural sorting (numeric-aware)."""
@@ -117,27 +131,21 @@ class FileLoaderService:
         return [int(c) if c.isdigit() else c.lower() 
                 for c in re.split(r'(\d+)', filename)]
     
-    @log_execution(start_msg="Time Series Load Started", end_msg="Time Series Load Completed")
-    def load_time_series(self, file_paths: List[str]) -> Tuple[List[Any], str]:
+    def prepare_time_series(self, file_paths: List[str]) -> Tuple[List[str], str]:
         """
-        Load all files in a time series.
+        Sort time series files and derive the series name without loading them.
         
         Args:
             file_paths: List of file paths in the series
             
         Returns:
-            Tuple of (list of vtk_data_objects, series_name)
+            Tuple of (sorted_paths, series_name)
         """
         if not file_paths:
             raise ValueError("No files provided for time series")
         
         sorted_paths = sorted(file_paths, key=self._natural_sort_key)
         
-        data_list = []
-        for path in sorted_paths:
-            data, _ = self.load(path)
-            data_list.append(data)
-        
         first_name = os.path.basename(sorted_paths[0])
         last_name = os.path.basename(sorted_paths[-1])
         name, ext = os.path.splitext(first_name)
@@ -152,5 +160,4 @@ class FileLoaderService:
         else:
             series_name = f"{first_name} (series)"
         
-        return data_list, series_name, sorted_paths
-
+        return sorted_paths, series_name
@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+CacheKey = Tuple[str, int]  # (item_id, time index)
+
+
+class TimeSeriesCache:
+    """Bounded LRU cache of loaded time step datasets."""
+
+    def __init__(self, maxsize: int = 32):
+        self._maxsize = max(1, maxsize)
+        self._od: "OrderedDict[CacheKey, Any]" = OrderedDict()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._od)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._od
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """Return cached data and mark it most recently used, or None on miss."""
+        data = self._od.get(key)
+        if data is not None:
+            self._od.move_to_end(key)
+        return data
+
+    def put(self, key: CacheKey, data: Any) -> List[Tuple[CacheKey, Any]]:
+        """
+        Insert or refresh a time step.
+
+        Args:
+            key: (item_id, time index)
+            data: Loaded VTK data object
+
+        Returns:
+            Evicted (key, data) pairs, least recently used first
+        """
+        self._od[key] = data
+        self._od.move_to_end(key)
+
+        evicted = []
+        while len(self._od) > self._maxsize:
+            evicted.append(self._od.popitem(last=False))
+        return evicted
+
+    def discard_item(self, item_id: str) -> None:
+        """Drop every cached time step belonging to an item."""
+        for key in [key for key in self._od if key[0] == item_id]:
+            del self._od[key]
@@ -1,6 +1,6 @@
 import vtk
 from vtk.util import numpy_support
-from typing import Any, Tuple, List
+from typing import Any, Tuple, List, Optional
 import numpy as np
 from utils.logger import get_logger, log_execution
 
@@ -18,6 +18,7 @@ class VTKRenderService:
     def __init__(self):
         self._engine = sa_engine.Engine() if sa_engine else None
         self._actor_styles: dict[int, str] = {}
+        self._cone_data = None
     
     @property
     def engine(self):
@@ -25,7 +26,22 @@ class VTKRenderService:
     
     @log_execution(start_msg="Cone Source Creation Started", end_msg="Cone Source Created")
     def create_cone_source(self) -> Tuple[Any, Any]:
-        """Create a cone source with elevation scalars and vector field."""
+        """
+        Create a cone source with elevation scalars and vector field.
+        
+        The cone geometry is constant, so it is built once and shared by every
+        cone actor; each call only creates a new mapper and actor.
+        """
+        if self._cone_data is None:
+            self._cone_data = self._build_cone_data()
+        
+        actor = self.create_actor(self._cone_data)
+        actor.GetProperty().SetColor(1.0, 0.6, 0.2)
+        
+        return actor, self._cone_data
+    
+    def _build_cone_data(self) -> Any:
+        """Build cone polydata with elevation scalars and vector field."""
         cone = vtk.vtkConeSource()
         cone.SetHeight(3.0)
         cone.SetRadius(1.0)
@@ -60,10 +76,7 @@ class VTKRenderService:
             output_data.GetPointData().AddArray(vector_array)
             output_data.GetPointData().SetActiveVectors("VectorField")
         
-        actor = self.create_actor(output_data)
-        actor.GetProperty().SetColor(1.0, 0.6, 0.2)
-        
-        return actor, output_data
+        return output_data
     
     def create_actor(self, data: Any, use_dataset_mapper: bool = False) -> Any:
         """Create a VTK actor from data."""
@@ -90,7 +103,106 @@ class VTKRenderService:
         
         return actor
     
-
+    def update_data_in_place(self, target: Any, source: Any) -> None:
+        """
+        Copy the geometry and attribute arrays of source into target by reference.
+        
+        The cell topology of target is kept, so a mapper bound to target only
+        re-uploads what changed instead of rebuilding everything. The caller
+        must have checked same_topology() for this pair beforehand.
+        
+        Args:
+            target: Dataset the mapper is bound to
+            source: Dataset with the same topology (e.g. the next time step)
+        """
+        if isinstance(source, vtk.vtkPointSet):
+            target.SetPoints(source.GetPoints())
+        else:
+            target.CopyStructure(source)
+        target.GetPointData().ShallowCopy(source.GetPointData())
+        target.GetCellData().ShallowCopy(source.GetCellData())
+        target.Modified()
+    
+    def same_topology(self, target: Any, source: Any) -> bool:
+        """
+        Check that source provably has the same cells as target, not just equal counts.
+        
+        Compares the full connectivity, so call it once per loaded dataset
+        (e.g. in the loading worker) rather than per frame.
+        """
+        if (target.GetClassName() != source.GetClassName()
+                or target.GetNumberOfPoints() != source.GetNumberOfPoints()
+                or target.GetNumberOfCells() != source.GetNumberOfCells()):
+            return False
+        
+        if isinstance(target, (vtk.vtkImageData, vtk.vtkRectilinearGrid, vtk.vtkStructuredGrid)):
+            return target.GetDimensions() == source.GetDimensions()
+        if isinstance(target, vtk.vtkUnstructuredGrid):
+            return (self._cell_arrays_equal(target.GetCells(), source.GetCells())
+                    and self._vtk_arrays_equal(target.GetCellTypesArray(), source.GetCellTypesArray()))
+        if isinstance(target, vtk.vtkPolyData):
+            return all(
+                self._cell_arrays_equal(getattr(target, name)(), getattr(source, name)())
+                for name in ("GetVerts", "GetLines", "GetPolys", "GetStrips")
+            )
+        return False
+    
+    def _cell_arrays_equal(self, a: Any, b: Any) -> bool:
+        """Compare two vtkCellArrays by their offsets and connectivity."""
+        if a is b:
+            return True
+        if a is None or b is None:
+            return False
+        return (self._vtk_arrays_equal(a.GetOffsetsArray(), b.GetOffsetsArray())
+                and self._vtk_arrays_equal(a.GetConnectivityArray(), b.GetConnectivityArray()))
+    
+    @staticmethod
+    def _vtk_arrays_equal(a: Any, b: Any) -> bool:
+        """Compare two VTK data arrays by identity or value."""
+        if a is b:
+            return True
+        if a is None or b is None:
+            return False
+        return np.array_equal(numpy_support.vtk_to_numpy(a), numpy_support.vtk_to_numpy(b))
+    
+    def build_playback_lod(self, data: Any, level: int) -> Optional[Any]:
+        """
+        Build a reduced copy of a dataset for display during playback.
+        
+        Structured datasets are subsampled by 2**level along each axis, which
+        keeps surfaces as surfaces and carries both point and cell arrays.
+        Other dataset types have no reduction that preserves both, so they
+        are played back at full detail. Safe to call from worker threads as
+        long as nothing else is using data yet.
+        
+        Args:
+            data: Dataset to reduce
+            level: Level of detail, 0 for full detail
+        
+        Returns:
+            The reduced dataset, or None if data is not reduced
+        """
+        if level <= 0 or data is None:
+            return None
+        
+        if isinstance(data, vtk.vtkImageData):
+            extractor = vtk.vtkExtractVOI()
+        elif isinstance(data, vtk.vtkStructuredGrid):
+            extractor = vtk.vtkExtractGrid()
+        elif isinstance(data, vtk.vtkRectilinearGrid):
+            extractor = vtk.vtkExtractRectilinearGrid()
+        else:
+            return None
+        
+        rate = 2 ** level
+        extractor.SetInputData(data)
+        extractor.SetVOI(data.GetExtent())
+        extractor.SetSampleRate(rate, rate, rate)
+        extractor.Update()
+        
+        lod = extractor.GetOutput().NewInstance()
+        lod.ShallowCopy(extractor.GetOutput())
+        return lod
     
     def set_representation(self, actor: Any, style: str) -> None:
         """Set actor representation style."""
@@ -140,9 +252,9 @@ class VTKRenderService:
         
         logger.info(f"Representation set to '{style}' for actor {id(actor)}")
     
-    def get_representation_style(self, actor: Any) -> str:
-        """Get actor's current representation style."""
-        return self._actor_styles.get(id(actor), 'Surface')
+    def get_representation_style(self, actor: Any, default: Optional[str] = 'Surface') -> Optional[str]:
+        """Get actor's current representation style, or default if never set."""
+        return self._actor_styles.get(id(actor), default)
     
     def _get_data_object(self, data: Any, array_type: str):
         """Get PointData or CellData based on array type."""
@@ -163,8 +275,13 @@ class VTKRenderService:
         data_obj.AddArray(result_arr)
         return result_arr, derived_name
     
-    def set_color_by(self, actor: Any, array_name: str, array_type: str = 'POINT', component: str = 'Magnitude') -> None:
-        """Set coloring by scalar array. For vector arrays, can use magnitude or components (X, Y, Z)."""
+    def set_color_by(self, actor: Any, array_name: str, array_type: str = 'POINT', component: str = 'Magnitude',
+                     data: Any = None) -> None:
+        """
+        Set coloring by scalar array. For vector arrays, can use magnitude or components (X, Y, Z).
+        
+        The array is looked up in data, or in the mapper input if data is None.
+        """
         mapper = actor.GetMapper()
         if not mapper:
             logger.warning("set_color_by: Actor has no mapper")
@@ -175,7 +292,8 @@ class VTKRenderService:
             logger.info("Color By Set: Solid Color")
             return
         
-        data = mapper.GetInput()
+        if data is None:
+            data = mapper.GetInput()
         if not data:
             logger.warning("set_color_by: Mapper has no input data")
             return
@@ -77,16 +77,26 @@ def log_execution(
     @log_execution(level="INFO")
     @log_execution(start_msg="Loading data...", end_msg="Data loaded")
     """
+    level_no = getattr(logging, level.upper(), logging.DEBUG)
+
     def decorator(f: Callable) -> Callable:
+        # Resolve logger for the function's module
+        logger = get_logger(f.__module__)
+        
+        # Get the logging method (debug, info, etc.)
+        log_method = getattr(logger, level.lower(), logger.debug)
+        
+        func_name = f.__qualname__
+        
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            # Resolve logger for the function's module
-            logger = get_logger(f.__module__)
-            
-            # Get the logging method (debug, info, etc.)
-            log_method = getattr(logger, level.lower(), logger.debug)
-            
-            func_name = f.__qualname__
+            # Level is checked per call since setup_logger() may change it after import
+            if not _logger.isEnabledFor(level_no):
+                try:
+                    return f(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"Error in {func_name}: {e}")
+                    raise
             
             # Use custom start message or default
             msg_start = start_msg if start_msg is not None else f"Starting {func_name}..."
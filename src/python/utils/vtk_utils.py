@@ -0,0 +1,33 @@
+from typing import Any, Optional, Tuple
+import numpy as np
+from vtk.util import numpy_support
+
+
+def _array_range(array: Any) -> Optional[Tuple[float, float]]:
+    """Range of the first component of a VTK array, ignoring NaNs."""
+    values = numpy_support.vtk_to_numpy(array)
+    if values.ndim > 1:
+        values = values[:, 0]
+    if values.size == 0 or np.isnan(values).all():
+        return None
+    return float(np.nanmin(values)), float(np.nanmax(values))
+
+
+def fast_scalar_range(data: Any) -> Tuple[float, float]:
+    """
+    Compute a dataset's scalar range with vectorized NumPy reductions.
+    
+    Matches vtkDataSet.GetScalarRange(): the union of the active point and
+    cell scalar ranges (first component), or (0.0, 1.0) if there are none.
+    """
+    ranges = []
+    for attributes in (data.GetPointData(), data.GetCellData()):
+        scalars = attributes.GetScalars()
+        if scalars is not None:
+            array_range = _array_range(scalars)
+            if array_range:
+                ranges.append(array_range)
+    
+    if not ranges:
+        return 0.0, 1.0
+    return min(r[0] for r in ranges), max(r[1] for r in ranges)
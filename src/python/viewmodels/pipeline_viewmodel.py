@@ -1,32 +1,94 @@
-from PySide6.QtCore import QObject, Signal
+import copy
+import os
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from PySide6.QtCore import QObject, Signal, QTimer
 from typing import Optional, List, Dict, Any
-from models.pipeline_item import PipelineItem
+import vtk
+from models.pipeline_item import PipelineItem, ColorByInfo
 from services.vtk_render_service import VTKRenderService
 from services.file_loader_service import FileLoaderService
+from services.time_series_cache import TimeSeriesCache
 import filters
 from utils.logger import get_logger, log_execution
+from utils.vtk_utils import fast_scalar_range
 from utils.tool_registry import expose_tool
 
 logger = get_logger("PipelineVM")
 
+_MISSING = object()
+
 
 class PipelineViewModel(QObject):
     """ViewModel for managing the visualization pipeline."""
     
     item_added = Signal(object)  # PipelineItem
-    item_removed = Signal(str)   # item_id
+    items_removed = Signal(list)  # removed PipelineItems, parents before children
     item_updated = Signal(object)  # PipelineItem
     selection_changed = Signal(object)  # PipelineItem or None
     message = Signal(str)  # Status messages
     time_series_loaded = Signal(object)  # PipelineItem with time series
+    time_step_changed = Signal(object)  # PipelineItem; lightweight update during playback
+    items_batch_changed = Signal(list, list)  # added, updated PipelineItems from a bulk_changes() block
+    file_loaded = Signal(object)  # PipelineItem or None, result of load_files_async()
+    _param_flush_requested = Signal()
+    _filter_finished = Signal(str, object, object, int)  # item_id, output data or None, params used, generation
+    _time_step_loaded = Signal(str, int, object)  # item_id, index, finished Future
+    _files_read = Signal(object)  # finished Future of a load_files_async() read
+    _bulk_flushed = Signal(object)  # signals queued by a bulk_changes() block, delivered on the owning thread
+    
+    PARAM_FLUSH_INTERVAL_MS = 16
+    PREFETCH_AHEAD = 2
+    TIME_STEP_CACHE_SIZE = 32  # Resident time steps across all series
     
     def __init__(self, render_service: VTKRenderService, file_loader: FileLoaderService):
         super().__init__()
         self._render_service = render_service
         self._file_loader = file_loader
         self._items: dict[str, PipelineItem] = {}
+        self._children: dict[str, set[str]] = {}  # parent_id -> child ids
         self._selected_id: Optional[str] = None
         self._filter_instances: Dict[str, Any] = {}
+        self._placeholder_ids: set[str] = set()
+        self._preview_actor_pool: dict[str, Any] = {}  # parent_id -> released placeholder actor
+        
+        # Tools open bulk_changes() on the agent thread, so each thread nests and queues separately
+        self._bulk_state = threading.local()
+        self._bulk_flushed.connect(self._flush_bulk_queue)
+        
+        # XML readers release the GIL while parsing, so loads scale with worker count
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="TimeStepPrefetch")
+        self._prefetch_futures: dict[tuple[str, int], Future] = {}
+        self._prefetch_windows: dict[str, set[int]] = {}  # item_id -> steps still wanted in the cache
+        self._time_step_loaded.connect(self._on_time_step_loaded)
+        self._time_step_cache = TimeSeriesCache(self.TIME_STEP_CACHE_SIZE)
+        self._display_data: dict[str, Any] = {}  # item_id -> dataset bound to the series mapper
+        self._topology_refs: dict[str, Any] = {}  # item_id -> cells of the display dataset, never modified
+        self._in_place_steps: set[tuple[str, int]] = set()  # (item_id, index) steps matching that topology
+        self._playback_lods: dict[tuple[str, int], tuple[int, Any]] = {}  # (item_id, index) -> (level, reduced step) built off-thread
+        
+        # VTK releases the GIL inside Update(), so independent branches really run in parallel
+        self._filter_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="FilterExec")
+        self._filter_in_flight: set[str] = set()
+        self._filter_queue: list[str] = []
+        # Every commit (async or from a tool) takes a new generation; older results are dropped
+        self._filter_generations: dict[str, int] = {}
+        self._filter_generation_lock = threading.Lock()
+        self._filter_finished.connect(self._on_filter_finished)
+        
+        # User file loads run one at a time, in the order they were requested
+        self._load_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="FileLoad")
+        self._files_read.connect(self._on_files_read)
+        
+        self._pending_param_updates: set[str] = set()
+        self._emitted_params: dict[str, dict] = {}
+        self._param_flush_timer = QTimer(self)
+        self._param_flush_timer.setSingleShot(True)
+        self._param_flush_timer.setInterval(self.PARAM_FLUSH_INTERVAL_MS)
+        self._param_flush_timer.timeout.connect(self._flush_param_updates)
+        # Routed through a signal so tool calls from the agent thread arm the timer on the GUI thread
+        self._param_flush_requested.connect(self._param_flush_timer.start)
     
     @property
     def items(self) -> dict[str, PipelineItem]:
@@ -42,22 +104,85 @@ class PipelineViewModel(QObject):
     def render_service(self) -> VTKRenderService:
         return self._render_service
     
+    @contextmanager
+    def bulk_changes(self):
+        """
+        Defer item signals until the outermost block exits.
+        
+        Queued item_added/item_updated emissions are delivered together as one
+        items_batch_changed and the remaining signals are replayed in order.
+        Blocks are tracked per thread; a block closed on another thread is
+        flushed on the thread that owns this view model.
+        """
+        state = self._bulk_state
+        if not getattr(state, "depth", 0):
+            state.depth = 0
+            state.queue = []
+        state.depth += 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            if state.depth == 0:
+                queue, state.queue = state.queue, []
+                if queue:
+                    self._bulk_flushed.emit(queue)
+    
+    def _emit(self, signal_name: str, *args) -> None:
+        """Emit an item signal, or queue it while inside bulk_changes() on this thread."""
+        state = self._bulk_state
+        if getattr(state, "depth", 0):
+            state.queue.append((signal_name, args))
+        else:
+            getattr(self, signal_name).emit(*args)
+    
+    def _flush_bulk_queue(self, queue: list) -> None:
+        """Emit queued item signals, batching additions and updates (owning thread)."""
+        
+        added: dict[str, PipelineItem] = {}
+        updated: dict[str, PipelineItem] = {}
+        others = []
+        for signal_name, args in queue:
+            if signal_name == "item_added":
+                added[args[0].id] = args[0]
+            elif signal_name == "item_updated":
+                updated[args[0].id] = args[0]
+            else:
+                others.append((signal_name, args))
+        
+        # Newly added items are shown in their final state, so they need no update
+        added_items = [item for item_id, item in added.items() if item_id in self._items]
+        updated_items = [
+            item for item_id, item in updated.items()
+            if item_id in self._items and item_id not in added
+        ]
+        if added_items or updated_items:
+            self.items_batch_changed.emit(added_items, updated_items)
+        
+        for signal_name, args in others:
+            getattr(self, signal_name).emit(*args)
+    
+    def shutdown(self) -> None:
+        """Stop background work so application exit does not wait on queued loads and filters."""
+        for executor in (self._prefetch_executor, self._filter_executor, self._load_executor):
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def get_filter(self, filter_type: str):
-        """Get or create a filter instance."""
-        if filter_type not in self._filter_instances:
+        """Get or create a filter instance (created on first use)."""
+        filter_instance = self._filter_instances.get(filter_type, _MISSING)
+        if filter_instance is _MISSING:
             filter_class = filters.get_filter(filter_type)
-            if filter_class:
-                self._filter_instances[filter_type] = filter_class(self._render_service)
-        return self._filter_instances.get(filter_type)
+            if filter_class is None:
+                return None
+            filter_instance = self._filter_instances[filter_type] = filter_class(self._render_service)
+        return filter_instance
     
     def get_available_filters(self) -> List[tuple]:
         """Get list of (filter_type, display_name) for all registered filters."""
-        result = []
-        for filter_type in filters.get_all_filter_types():
-            filter_instance = self.get_filter(filter_type)
-            if filter_instance:
-                result.append((filter_type, filter_instance.display_name))
-        return result
+        return [
+            (filter_type, filters.get_display_name(filter_type))
+            for filter_type in filters.get_all_filter_types()
+        ]
     
     @expose_tool(
         name="get_pipeline_info",
@@ -72,21 +197,22 @@ class PipelineViewModel(QObject):
         if not self._items:
             return "No items in pipeline. Load a file first."
         
-        result = []
+        parts = ["Pipeline items:\n"]
+        append = parts.append
         for item_id, item in self._items.items():
-            info = f"- {item.name} (type: {item.item_type}, id: {item_id}, visible: {item.visible})"
-            if item.parent_id:
-                info += f" [parent: {item.parent_id}]"
-            if item.vtk_data:
-                num_points = item.vtk_data.GetNumberOfPoints()
-                num_cells = item.vtk_data.GetNumberOfCells()
-                info += f" [points: {num_points}, cells: {num_cells}]"
-            result.append(info)
+            parent_id = item.parent_id
+            data = item.vtk_data
+            parent_info = f" [parent: {parent_id}]" if parent_id else ""
+            data_info = (
+                f" [points: {data.GetNumberOfPoints()}, cells: {data.GetNumberOfCells()}]" if data else ""
+            )
+            append(f"- {item.name} (type: {item.item_type}, id: {item_id}, visible: {item.visible})"
+                   f"{parent_info}{data_info}\n")
         
         selected = self.selected_item
-        selected_info = f"\nCurrently selected: {selected.name} ({selected.id})" if selected else "\nNo item selected"
+        append(f"Currently selected: {selected.name} ({selected.id})" if selected else "No item selected")
         
-        return "Pipeline items:\n" + "\n".join(result) + selected_info
+        return "".join(parts)
     
     @expose_tool(
         name="select_pipeline_item",
@@ -101,17 +227,15 @@ class PipelineViewModel(QObject):
     def select_item(self, item_id: Optional[str]) -> str:
         """Select a pipeline item."""
         self._selected_id = item_id
-        self.selection_changed.emit(self.selected_item)
+        self._emit("selection_changed", self.selected_item)
         
         if self.selected_item:
             return f"Selected item: '{self.selected_item.name}' (id: {self.selected_item.id})"
         return "Selection cleared."
     
     def add_source(self, name: str, vtk_data, actor, item_type: str = "source", 
-                   parent_id: str = None, color_by: "ColorByInfo" = None) -> PipelineItem:
+                   parent_id: str = None, color_by: ColorByInfo = None) -> PipelineItem:
         """Add a new source to the pipeline."""
-        from models.pipeline_item import ColorByInfo
-        
         item = PipelineItem(
             name=name,
             item_type=item_type,
@@ -121,15 +245,15 @@ class PipelineViewModel(QObject):
             color_by=color_by if color_by else ColorByInfo(),
         )
         self._items[item.id] = item
-        self.item_added.emit(item)
+        if parent_id:
+            self._children.setdefault(parent_id, set()).add(item.id)
+        self._emit("item_added", item)
         logger.info(f"Source Added: {name} ({item.id})")
         return item
     
     @log_execution(start_msg="Creating Cone Source", end_msg="Cone Source Created")
     def create_cone_source(self) -> PipelineItem:
         """Create default cone source."""
-        from models.pipeline_item import ColorByInfo
-        
         actor, data = self._render_service.create_cone_source()
         color_by = ColorByInfo(array_name="Elevation", array_type="POINT", component="")
         self._render_service.set_color_by(actor, "Elevation", "POINT", "")
@@ -147,80 +271,374 @@ class PipelineViewModel(QObject):
             
             self.message.emit(f"Loading {file_path}...")
             data, filename = self._file_loader.load(file_path)
-            actor = self._render_service.create_actor_for_file(data)
-            
-            mapper = actor.GetMapper()
-            if mapper:
-                mapper.CreateDefaultLookupTable()
-                if data.GetScalarRange():
-                    mapper.SetScalarRange(data.GetScalarRange())
-            
-            item = self.add_source(filename, data, actor, "file_source")
-            self.message.emit(f"Loaded {filename}")
-            return item
+            return self._add_file_source(filename, data)
         except Exception as e:
             self.message.emit(f"Error loading file: {e}")
             return None
     
+    def _add_file_source(self, filename: str, data: Any) -> PipelineItem:
+        """Create the actor for loaded file data and add it to the pipeline."""
+        actor = self._render_service.create_actor_for_file(data)
+        
+        mapper = actor.GetMapper()
+        if mapper:
+            mapper.CreateDefaultLookupTable()
+            scalar_range = fast_scalar_range(data)
+            if scalar_range:
+                mapper.SetScalarRange(scalar_range)
+        
+        item = self.add_source(filename, data, actor, "file_source")
+        self.message.emit(f"Loaded {filename}")
+        return item
+    
     @log_execution(start_msg="Loading Time Series File", end_msg="Time Series File Loaded")
     def load_time_series(self, file_paths: List[str]) -> Optional[PipelineItem]:
         """Load a time series of VTK files and add to pipeline."""
         try:
             self.message.emit(f"Loading time series ({len(file_paths)} files)...")
             
-            data_list, series_name, sorted_paths = self._file_loader.load_time_series(file_paths)
-            
-            first_data = data_list[0]
-            actor = self._render_service.create_actor_for_file(first_data)
-            
-            mapper = actor.GetMapper()
-            if mapper:
-                mapper.CreateDefaultLookupTable()
-                if first_data.GetScalarRange():
-                    mapper.SetScalarRange(first_data.GetScalarRange())
-            
-            item = PipelineItem(
-                name=series_name,
-                item_type="time_series_source",
-                vtk_data=first_data,
-                actor=actor,
-                is_time_series=True,
-                time_steps=data_list,
-                time_file_paths=sorted_paths,
-                current_time_index=0,
-            )
-            self._items[item.id] = item
-            self.item_added.emit(item)
-            self.time_series_loaded.emit(item)
-            
-            self.message.emit(f"Loaded time series: {series_name} ({len(sorted_paths)} steps)")
-            return item
+            sorted_paths, series_name = self._file_loader.prepare_time_series(file_paths)
+            first_data = self._load_time_step(sorted_paths[0])
+            return self._add_time_series(series_name, sorted_paths, first_data)
         except Exception as e:
             self.message.emit(f"Error loading time series: {e}")
             return None
     
-    def update_time_step(self, item_id: str, time_index: int) -> None:
-        """Update item to show specific time step."""
+    def _add_time_series(self, series_name: str, sorted_paths: List[str], first_data: Any) -> PipelineItem:
+        """Create the actor for a loaded time series and add it to the pipeline."""
+        # The mapper stays bound to one dataset; later steps with the same
+        # topology are swapped into it instead of rebinding the mapper
+        display_data = first_data.NewInstance()
+        display_data.ShallowCopy(first_data)
+        # Loading workers compare each step against this instead of the mutable display dataset
+        topology_ref = first_data.NewInstance()
+        topology_ref.CopyStructure(first_data)
+        actor = self._render_service.create_actor_for_file(display_data)
+        
+        mapper = actor.GetMapper()
+        if mapper:
+            mapper.CreateDefaultLookupTable()
+            scalar_range = fast_scalar_range(first_data)
+            if scalar_range:
+                mapper.SetScalarRange(scalar_range)
+        
+        item = PipelineItem(
+            name=series_name,
+            item_type="time_series_source",
+            vtk_data=first_data,
+            actor=actor,
+            is_time_series=True,
+            time_steps=[first_data] + [None] * (len(sorted_paths) - 1),
+            time_file_paths=sorted_paths,
+            current_time_index=0,
+        )
+        with self.bulk_changes():
+            self._items[item.id] = item
+            self._display_data[item.id] = display_data
+            self._topology_refs[item.id] = topology_ref
+            self._in_place_steps.add((item.id, 0))
+            self._cache_time_step(item.id, 0, first_data)
+            self._emit("item_added", item)
+            self._emit("time_series_loaded", item)
+        
+        self.message.emit(f"Loaded time series: {series_name} ({len(sorted_paths)} steps)")
+        return item
+    
+    def load_files_async(self, file_paths: List[str]) -> None:
+        """
+        Load user-selected files without blocking the GUI thread.
+        
+        Files are read on the load worker; actors and pipeline items are created
+        back on the GUI thread, and file_loaded reports the new item (or None).
+        A single path is checked for sibling time steps, as in load_file().
+        """
+        if len(file_paths) > 1:
+            self.message.emit(f"Loading time series ({len(file_paths)} files)...")
+        else:
+            self.message.emit(f"Loading {file_paths[0]}...")
+        future = self._load_executor.submit(self._read_files, list(file_paths))
+        future.add_done_callback(self._files_read.emit)
+    
+    def _read_files(self, file_paths: List[str]) -> tuple:
+        """
+        Worker body: read the data for a load_files_async() request.
+        
+        Returns:
+            (sorted_paths, series_name, first_data) for a time series, or
+            (None, filename, data) for a single file
+        """
+        if len(file_paths) == 1:
+            series_files = self._file_loader.detect_time_series(file_paths[0])
+            if not series_files or len(series_files) <= 1:
+                data, filename = self._file_loader.load(file_paths[0])
+                return None, filename, data
+            file_paths = series_files
+        
+        sorted_paths, series_name = self._file_loader.prepare_time_series(file_paths)
+        return sorted_paths, series_name, self._load_time_step(sorted_paths[0])
+    
+    def _on_files_read(self, future: Future) -> None:
+        """Add the data read by a load_files_async() request to the pipeline (GUI thread)."""
+        item = None
+        try:
+            sorted_paths, name, data = future.result()
+            if sorted_paths is None:
+                item = self._add_file_source(name, data)
+            else:
+                item = self._add_time_series(name, sorted_paths, data)
+        except Exception as e:
+            logger.error(f"File load failed: {e}")
+            self.message.emit(f"Error loading file: {e}")
+        self.file_loaded.emit(item)
+    
+    def update_time_step(self, item_id: str, time_index: int, is_scrubbing: bool = False,
+                         loop: bool = False, direction: int = 1) -> None:
+        """
+        Update item to show specific time step, loading it on demand.
+        
+        While scrubbing (animation playback) only time_step_changed is emitted so
+        that views other than the 3D viewport are not refreshed on every frame.
+        The next steps in the given direction (1 forward, -1 backward) are then
+        prefetched in the background, wrapping around when loop playback is enabled.
+        """
         item = self._items.get(item_id)
         if not item or not item.is_time_series:
             return
         
-        item.set_time_index(time_index)
+        time_index = max(0, min(time_index, item.max_time_index))
+        previous_index = item.current_time_index
+        if time_index == previous_index:
+            return
         
-        if item.actor and item.vtk_data:
-            mapper = item.actor.GetMapper()
-            if mapper:
-                mapper.SetInputData(item.vtk_data)
-                mapper.Modified()
+        try:
+            self._ensure_time_step_loaded(item, time_index)
+        except Exception as e:
+            logger.error(f"Time step load failed: {item.time_file_paths[time_index]} ({e})")
+            self.message.emit(f"Error loading time step {time_index}: {e}")
+            return
+        
+        if not item.set_time_index(time_index):
+            return
+        
+        self._bind_time_step_display(item)
+        if (item.id, previous_index) not in self._time_step_cache:
+            # Evicted while it was on screen; drop it now that nothing shows it
+            previous_data = item.time_steps[previous_index]
+            item.time_steps[previous_index] = None
+            self._release_time_step(item, previous_index, previous_data)
         
-        self.item_updated.emit(item)
+        self._emit("time_step_changed" if is_scrubbing else "item_updated", item)
+        self._prefetch_time_steps(item, wrap=loop, direction=direction)
+    
+    def refresh_time_step_display(self, item_id: str) -> None:
+        """Rebind the current time step, e.g. to restore full detail after playback."""
+        item = self._items.get(item_id)
+        if item and item.is_time_series:
+            self._bind_time_step_display(item)
+            self._emit("time_step_changed", item)
+    
+    def _bind_time_step_display(self, item: PipelineItem) -> None:
+        """Point the item's mapper at the current time step, reduced while animating."""
+        mapper = item.actor.GetMapper() if item.actor else None
+        if not mapper or not item.vtk_data:
+            return
+        
+        # Kept current even while a reduced step is shown; coloring resolves against it
+        target = self._display_data.get(item.id)
+        if target is not None and (item.id, item.current_time_index) in self._in_place_steps:
+            self._render_service.update_data_in_place(target, item.vtk_data)
+        else:
+            self._display_data.pop(item.id, None)
+            self._topology_refs.pop(item.id, None)
+            target = item.vtk_data
+        
+        lod = self._playback_lod_for(item, mapper)
+        if lod is not None:
+            target = lod
+        
+        # SetInputData() already marks the mapper modified
+        if mapper.GetInput() is not target:
+            mapper.SetInputData(target)
+    
+    def _playback_lod_for(self, item: PipelineItem, mapper: Any) -> Any:
+        """Return the reduced current step if playing and it can show the current coloring."""
+        if item.playback_lod <= 0:
+            return None
+        level, lod = self._playback_lods.get((item.id, item.current_time_index), (0, None))
+        if lod is None or level != item.playback_lod:
+            return None
+        # Derived arrays (e.g. magnitudes) only exist on the full detail step
+        array_name = mapper.GetArrayName() if mapper.GetScalarVisibility() else None
+        if array_name:
+            attributes = lod.GetPointData() if item.color_by.array_type == 'POINT' else lod.GetCellData()
+            if attributes.GetArray(array_name) is None:
+                return None
+        return lod
+    
+    def _full_detail_data(self, item: PipelineItem, mapper: Any) -> Any:
+        """Return the full detail dataset behind the item's mapper, even while a reduced step is shown."""
+        if item.is_time_series:
+            return self._display_data.get(item.id, item.vtk_data)
+        return mapper.GetInput()
+    
+    def _load_time_step(self, file_path: str) -> Any:
+        """Load a single time step file (safe to call from worker threads)."""
+        data, _ = self._file_loader.load(file_path)
+        return data
+    
+    def _prefetch_time_step(self, file_path: str, topology_ref: Any, lod_level: int) -> tuple:
+        """Load a time step, check its topology and build its playback reduction in a worker thread."""
+        data = self._load_time_step(file_path)
+        same_topology = topology_ref is not None and self._render_service.same_topology(topology_ref, data)
+        return data, same_topology, lod_level, self._render_service.build_playback_lod(data, lod_level)
+    
+    def _record_topology(self, item_id: str, index: int, same_topology: bool) -> None:
+        """Remember whether a resident time step can be swapped into the display dataset."""
+        if same_topology:
+            self._in_place_steps.add((item_id, index))
+        else:
+            self._in_place_steps.discard((item_id, index))
+    
+    def _store_playback_lod(self, item_id: str, index: int, level: int, lod: Any) -> None:
+        """Keep the reduced version of a resident time step for playback."""
+        if lod is not None:
+            self._playback_lods[(item_id, index)] = (level, lod)
+    
+    def _discard_step_state(self, item_id: str) -> None:
+        """Drop the reduced versions and topology verdicts of every time step of an item."""
+        for key in [key for key in self._playback_lods if key[0] == item_id]:
+            del self._playback_lods[key]
+        self._in_place_steps = {key for key in self._in_place_steps if key[0] != item_id}
+        self._topology_refs.pop(item_id, None)
+    
+    def _ensure_time_step_loaded(self, item: PipelineItem, index: int) -> None:
+        """Make sure time step data is resident, reusing a prefetch that is already running."""
+        if item.time_steps[index] is not None:
+            self._time_step_cache.get((item.id, index))
+            return
+        
+        future = self._prefetch_futures.pop((item.id, index), None)
+        data = None
+        # A load still queued behind other prefetches is done here instead of waiting its turn
+        if future is not None and not future.cancel():
+            try:
+                data, same_topology, lod_level, lod = future.result()
+                self._record_topology(item.id, index, same_topology)
+                self._store_playback_lod(item.id, index, lod_level, lod)
+            except Exception as e:
+                logger.warning(f"Prefetch failed for time step {index}, reloading: {e}")
+        
+        if data is None:
+            data = self._load_time_step(item.time_file_paths[index])
+            topology_ref = self._topology_refs.get(item.id)
+            self._record_topology(
+                item.id, index, topology_ref is not None and self._render_service.same_topology(topology_ref, data)
+            )
+        item.time_steps[index] = data
+        self._cache_time_step(item.id, index, data)
+    
+    def _cache_time_step(self, item_id: str, index: int, data: Any) -> None:
+        """Record a resident time step and release whatever the cache evicts."""
+        for (evicted_id, evicted_index), evicted_data in self._time_step_cache.put((item_id, index), data):
+            evicted_item = self._items.get(evicted_id)
+            # The displayed step stays referenced until the item moves off it
+            if evicted_item and evicted_index != evicted_item.current_time_index:
+                evicted_item.time_steps[evicted_index] = None
+                self._release_time_step(evicted_item, evicted_index, evicted_data)
+    
+    def _release_time_step(self, item: PipelineItem, index: int, data: Any) -> None:
+        """Free the memory of a time step that left the cache, unless the mapper still renders it."""
+        mapper = item.actor.GetMapper() if item.actor else None
+        bound = mapper.GetInput() if mapper else None
+        _, lod = self._playback_lods.pop((item.id, index), (0, None))
+        self._in_place_steps.discard((item.id, index))
+        for dataset in (data, lod):
+            # Arrays shared with the display target stay alive through its references
+            if dataset is not None and dataset is not bound and dataset is not item.vtk_data:
+                dataset.ReleaseData()
+    
+    def _prefetch_time_steps(self, item: PipelineItem, wrap: bool = False, direction: int = 1) -> None:
+        """Start parallel background loads for the time steps following the current one."""
+        count = item.time_step_count
+        current = item.current_time_index
+        indices = [current + direction * offset for offset in range(1, min(self.PREFETCH_AHEAD, count - 1) + 1)]
+        if wrap:
+            indices = [i % count for i in indices]
+        else:
+            indices = [i for i in indices if 0 <= i < count]
+        # A wider window from prefetch_time_steps() is kept while it still covers these
+        window = self._prefetch_windows.get(item.id)
+        if window is None or not window.issuperset(indices):
+            self._prefetch_windows[item.id] = set(indices)
+        self._submit_time_step_loads(item, indices)
+    
+    def prefetch_time_steps(self, item_id: str, indices: List[int]) -> None:
+        """
+        Load a window of time steps in the background, in the given order.
+        
+        Queued loads for this item outside the window are cancelled, so the
+        pool always works on the frames playback will reach next. Loads that
+        were already running finish, but their results are dropped rather
+        than evicting frames near the new playhead from the cache.
+        """
+        item = self._items.get(item_id)
+        if not item or not item.is_time_series:
+            return
+        
+        window = set(indices)
+        self._prefetch_windows[item_id] = window
+        for key in [key for key in self._prefetch_futures if key[0] == item_id and key[1] not in window]:
+            if self._prefetch_futures[key].cancel():
+                del self._prefetch_futures[key]
+        self._submit_time_step_loads(item, indices)
+    
+    def _submit_time_step_loads(self, item: PipelineItem, indices) -> None:
+        """Submit background loads for time steps that are neither resident nor in flight."""
+        for index in indices:
+            key = (item.id, index)
+            if item.time_steps[index] is not None or key in self._prefetch_futures:
+                continue
+            future = self._prefetch_executor.submit(
+                self._prefetch_time_step, item.time_file_paths[index],
+                self._topology_refs.get(item.id), item.playback_lod
+            )
+            self._prefetch_futures[key] = future
+            future.add_done_callback(
+                lambda f, item_id=item.id, index=index: self._time_step_loaded.emit(item_id, index, f)
+            )
+    
+    def _on_time_step_loaded(self, item_id: str, index: int, future: Future) -> None:
+        """Slot a background-loaded time step into its item (GUI thread)."""
+        key = (item_id, index)
+        if self._prefetch_futures.get(key) is not future:
+            return  # Already consumed by update_time_step or cancelled
+        del self._prefetch_futures[key]
+        
+        item = self._items.get(item_id)
+        if not item or item.time_steps[index] is not None or future.cancelled():
+            return
+        if index not in self._prefetch_windows.get(item_id, ()):
+            return  # The playhead moved away while this step was loading
+        try:
+            data, same_topology, lod_level, lod = future.result()
+        except Exception as e:
+            logger.warning(f"Background load failed for time step {index}: {e}")
+            return
+        item.time_steps[index] = data
+        self._cache_time_step(item_id, index, data)
+        self._record_topology(item_id, index, same_topology)
+        self._store_playback_lod(item_id, index, lod_level, lod)
+    
+    def _cancel_prefetch(self, item_id: str) -> None:
+        """Cancel pending time step loads for an item."""
+        self._prefetch_windows.pop(item_id, None)
+        for key in [key for key in self._prefetch_futures if key[0] == item_id]:
+            self._prefetch_futures.pop(key).cancel()
     
     @log_execution(start_msg="Applying Filter", end_msg="Filter Applied")
     def apply_filter(self, filter_type: str, parent_id: str, 
                      params: dict = None) -> Optional[PipelineItem]:
         """Apply a filter to a parent item using the filter registry."""
-        import vtk
-        
         parent = self._items.get(parent_id)
         if not parent or not parent.vtk_data:
             self.message.emit("Please select a valid source.")
@@ -233,19 +651,14 @@ class PipelineViewModel(QObject):
         
         if params is None:
             params = filter_instance.create_default_params()
-            if hasattr(parent.vtk_data, 'GetCenter'):
-                center = parent.vtk_data.GetCenter()
-                if 'origin' in params:
-                    params['origin'] = list(center)
+            center = parent.center
+            if center is not None and 'origin' in params:
+                params['origin'] = list(center)
         
         if filter_instance.apply_immediately:
             actor, filtered_data = filter_instance.apply_filter(parent.vtk_data, params)
         else:
-            mapper = vtk.vtkDataSetMapper()
-            mapper.SetInputData(parent.vtk_data)
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-            actor.GetProperty().SetColor(1, 1, 1)
+            actor = self._create_placeholder_actor(parent)
             filtered_data = parent.vtk_data
         
         item = PipelineItem(
@@ -257,7 +670,11 @@ class PipelineViewModel(QObject):
             filter_params=params,
         )
         self._items[item.id] = item
-        self.item_added.emit(item)
+        self._children.setdefault(parent_id, set()).add(item.id)
+        self._emitted_params[item.id] = copy.deepcopy(params)
+        if not filter_instance.apply_immediately and parent.actor:
+            self._placeholder_ids.add(item.id)
+        self._emit("item_added", item)
         
         if filter_instance.apply_immediately:
             self.message.emit(f"Applied {filter_instance.display_name} filter to {parent.name}.")
@@ -265,20 +682,142 @@ class PipelineViewModel(QObject):
             self.message.emit(f"Created {filter_instance.display_name} filter. Click Apply to execute.")
         return item
     
+    def _create_placeholder_actor(self, parent: PipelineItem):
+        """Create an actor showing the parent data until the filter is committed.
+        
+        The actor shares the parent's mapper (and its GPU buffers) instead of
+        building a new one; only the property is separate. An actor released by
+        a deleted, uncommitted placeholder of the same parent is reused.
+        """
+        actor = self._preview_actor_pool.pop(parent.id, None) or vtk.vtkActor()
+        if parent.actor:
+            actor.ShallowCopy(parent.actor)
+            # ShallowCopy also copies the parent's visibility; the new item starts visible
+            actor.VisibilityOn()
+        else:
+            mapper = vtk.vtkDataSetMapper()
+            mapper.SetInputData(parent.vtk_data)
+            actor.SetMapper(mapper)
+        
+        prop = vtk.vtkProperty()
+        prop.SetColor(1, 1, 1)
+        actor.SetProperty(prop)
+        return actor
+    
+    def _detach_placeholder(self, item: PipelineItem, data: Any = None) -> bool:
+        """Give a placeholder item its own mapper so edits don't leak into the parent.
+        
+        Returns:
+            True if the item was a placeholder, False otherwise
+        """
+        if item.id not in self._placeholder_ids:
+            return False
+        
+        self._placeholder_ids.discard(item.id)
+        mapper = vtk.vtkDataSetMapper()
+        mapper.SetInputData(data if data is not None else item.vtk_data)
+        item.actor.SetMapper(mapper)
+        return True
+    
+    def notify_item_updated(self, item_id: str) -> None:
+        """Emit item_updated for an item, e.g. after a run of time_step_changed."""
+        item = self._items.get(item_id)
+        if item:
+            self._emit("item_updated", item)
+    
+    def detach_placeholder(self, item_id: str) -> None:
+        """Ensure the item's mapper is not shared before editing it directly."""
+        item = self._items.get(item_id)
+        if item and item.actor:
+            self._detach_placeholder(item)
+    
     def update_filter_params(self, item_id: str, params: dict) -> None:
-        """Update filter parameters (preview only, not applied yet)."""
+        """
+        Update filter parameters (preview only, not applied yet).
+        
+        Parameters are stored immediately, but item_updated is coalesced so a
+        burst of edits (e.g. spinbox drag) results in a single emission per frame.
+        """
         item = self._items.get(item_id)
-        if not item or "filter" not in item.item_type:
+        if not item or not item.is_filter:
             return
         
         item.filter_params.update(params)
-        self.item_updated.emit(item)
+        if item_id not in self._pending_param_updates:
+            self._pending_param_updates.add(item_id)
+            self._param_flush_requested.emit()
+    
+    def _flush_param_updates(self) -> None:
+        """Emit item_updated once for each item whose parameters actually changed."""
+        pending = self._pending_param_updates
+        self._pending_param_updates = set()
+        
+        for item_id in pending:
+            item = self._items.get(item_id)
+            if not item:
+                continue
+            if self._emitted_params.get(item_id) == item.filter_params:
+                continue
+            self._emitted_params[item_id] = copy.deepcopy(item.filter_params)
+            self._emit("item_updated", item)
     
     @log_execution(start_msg="Committing Filter", end_msg="Filter Committed")
     def commit_filter(self, item_id: str) -> None:
         """Apply filter changes using current parameters."""
         item = self._items.get(item_id)
-        if not item or "filter" not in item.item_type:
+        if not item or not item.is_filter:
+            return
+        
+        parent = self._items.get(item.parent_id)
+        if not parent or not parent.vtk_data:
+            return
+        
+        filter_instance = self.get_filter(item.item_type)
+        if not filter_instance:
+            return
+        
+        self.message.emit(f"Recalculating {filter_instance.display_name}...")
+        
+        generation = self._next_filter_generation(item_id)
+        params = copy.deepcopy(item.filter_params)
+        _, filtered_data = filter_instance.apply_filter(self._filter_input(parent), params)
+        if generation == self._filter_generations.get(item_id):
+            self._store_filter_result(item, filtered_data, params)
+    
+    def _next_filter_generation(self, item_id: str) -> int:
+        """Start a new filter run for an item, superseding any run still in flight."""
+        with self._filter_generation_lock:
+            generation = self._filter_generations.get(item_id, 0) + 1
+            self._filter_generations[item_id] = generation
+        return generation
+    
+    @staticmethod
+    def _filter_input(parent: PipelineItem) -> Any:
+        """
+        Private dataset object for a filter run, sharing the parent's arrays.
+        
+        Filters only read the arrays, but VTK builds bounds, links and locators
+        lazily on the dataset object. A shallow copy gives each run its own
+        object for those without copying the data on the submitting thread.
+        """
+        data = parent.vtk_data.NewInstance()
+        data.ShallowCopy(parent.vtk_data)
+        return data
+    
+    def commit_filter_async(self, item_id: str) -> None:
+        """
+        Apply filter changes on the filter worker pool.
+        
+        Filters on independent branches are computed in parallel. A commit whose
+        item or parent is still being computed is queued until that finishes.
+        """
+        item = self._items.get(item_id)
+        if not item or not item.is_filter:
+            return
+        
+        if item_id in self._filter_in_flight or item.parent_id in self._filter_in_flight:
+            if item_id not in self._filter_queue:
+                self._filter_queue.append(item_id)
             return
         
         parent = self._items.get(item.parent_id)
@@ -290,12 +829,46 @@ class PipelineViewModel(QObject):
             return
         
         self.message.emit(f"Recalculating {filter_instance.display_name}...")
+        self._filter_in_flight.add(item_id)
+        self._filter_executor.submit(
+            self._run_filter, item_id, filter_instance, self._filter_input(parent),
+            copy.deepcopy(item.filter_params), self._next_filter_generation(item_id)
+        )
+    
+    def _run_filter(self, item_id: str, filter_instance, data: Any, params: dict, generation: int) -> None:
+        """Worker body: compute the filter output and hand it back to the GUI thread."""
+        try:
+            _, filtered_data = filter_instance.apply_filter(data, params)
+        except Exception as e:
+            logger.error(f"Filter execution failed for {item_id}: {e}")
+            filtered_data = None
+        self._filter_finished.emit(item_id, filtered_data, params, generation)
+    
+    def _on_filter_finished(self, item_id: str, filtered_data: Any, params: dict, generation: int) -> None:
+        """Store a background filter result and start commits that were waiting on it."""
+        self._filter_in_flight.discard(item_id)
+        
+        item = self._items.get(item_id)
+        # A later commit (e.g. from an agent tool) superseded this run
+        if item and generation == self._filter_generations.get(item_id):
+            if filtered_data is None:
+                self.message.emit("Filter failed.")
+            else:
+                self._store_filter_result(item, filtered_data, params)
         
-        _, filtered_data = filter_instance.apply_filter(parent.vtk_data, item.filter_params)
+        queued = self._filter_queue
+        self._filter_queue = []
+        for queued_id in queued:
+            self.commit_filter_async(queued_id)
+    
+    def _store_filter_result(self, item: PipelineItem, filtered_data: Any, params: dict) -> None:
+        """Attach freshly computed filter output to the item and notify views."""
         item.vtk_data = filtered_data
-        item.actor.GetMapper().SetInputData(filtered_data)
+        if not self._detach_placeholder(item, filtered_data):
+            item.actor.GetMapper().SetInputData(filtered_data)
+        self._emitted_params[item.id] = params
         self.message.emit("Filter applied.")
-        self.item_updated.emit(item)
+        self._emit("item_updated", item)
     
     @expose_tool(
         name="delete_item",
@@ -315,22 +888,46 @@ class PipelineViewModel(QObject):
         if not item:
             return
         
-        children_to_delete = [
-            child_id for child_id, child in self._items.items()
-            if child.parent_id == item_id
-        ]
-        for child_id in children_to_delete:
-            self.delete_item(child_id)
+        removed = []
+        released_previews = []
+        for removed_id in self._collect_subtree(item_id):
+            removed.append(self._items.pop(removed_id))
+            self._children.pop(removed_id, None)
+            self._emitted_params.pop(removed_id, None)
+            self._pending_param_updates.discard(removed_id)
+            if removed_id in self._placeholder_ids:
+                self._placeholder_ids.discard(removed_id)
+                released_previews.append(removed[-1])
+            self._preview_actor_pool.pop(removed_id, None)
+            self._cancel_prefetch(removed_id)
+            self._time_step_cache.discard_item(removed_id)
+            self._display_data.pop(removed_id, None)
+            self._discard_step_state(removed_id)
+            if removed_id in self._filter_queue:
+                self._filter_queue.remove(removed_id)
+            self._filter_generations.pop(removed_id, None)
         
-        del self._items[item_id]
+        siblings = self._children.get(item.parent_id)
+        if siblings:
+            siblings.discard(item_id)
+        for preview in released_previews:
+            if preview.parent_id in self._items:
+                self._preview_actor_pool[preview.parent_id] = preview.actor
         
-        if self._selected_id == item_id:
+        if self._selected_id and self._selected_id not in self._items:
             self._selected_id = None
-            self.selection_changed.emit(None)
+            self._emit("selection_changed", None)
         
-        self.item_removed.emit(item_id)
+        self._emit("items_removed", removed)
         return f"Deleted item {item_id} and its children."
     
+    def _collect_subtree(self, item_id: str) -> List[str]:
+        """Collect an item and all its descendants breadth-first."""
+        ids = [item_id]
+        for current_id in ids:  # ids grows while iterating
+            ids.extend(self._children.get(current_id, ()))
+        return ids
+    
     @expose_tool(
         name="set_visibility",
         description=(
@@ -346,10 +943,12 @@ class PipelineViewModel(QObject):
         """Set item visibility."""
         item = self._items.get(item_id)
         if item and item.actor:
+            state = "visible" if visible else "hidden"
+            if item.visible == visible:
+                return f"'{item.name}' is already {state}."
             item.visible = visible
             item.actor.SetVisibility(visible)
-            self.item_updated.emit(item)
-            state = "visible" if visible else "hidden"
+            self._emit("item_updated", item)
             return f"Set '{item.name}' to {state}."
         return f"Item {item_id} not found."
     
@@ -368,8 +967,11 @@ class PipelineViewModel(QObject):
         """Set representation style for an item."""
         item = self._items.get(item_id)
         if item and item.actor:
+            if self._render_service.get_representation_style(item.actor, default=None) == style:
+                return f"'{item.name}' representation is already '{style}'."
+            self._detach_placeholder(item)
             self._render_service.set_representation(item.actor, style)
-            self.item_updated.emit(item)
+            self._emit("item_updated", item)
             self.message.emit(f"Set '{item.name}' representation to {style}.")
             return f"Set '{item.name}' representation to '{style}'."
         return f"Item {item_id} not found."
@@ -389,16 +991,41 @@ class PipelineViewModel(QObject):
     )
     def set_color_by(self, item_id: str, array_name: str, array_type: str = 'POINT', component: str = '') -> str:
         """Set coloring by scalar array."""
-        from models.pipeline_item import ColorByInfo
-        
         item = self._items.get(item_id)
         if item and item.actor:
-            self._render_service.set_color_by(item.actor, array_name, array_type, component)
+            if self._is_colored_by(item, array_name, array_type, component):
+                return f"'{item.name}' is already colored by '{array_name}' ({array_type})."
+            self._detach_placeholder(item)
+            mapper = item.actor.GetMapper()
+            data = self._full_detail_data(item, mapper) if mapper else None
+            self._render_service.set_color_by(item.actor, array_name, array_type, component, data)
             item.color_by = ColorByInfo(array_name=array_name, array_type=array_type, component=component)
-            self.item_updated.emit(item)
+            if item.is_time_series:
+                # A reduced step lacking the array is swapped for the full detail one
+                self._bind_time_step_display(item)
+            self._emit("item_updated", item)
             return f"Set '{item.name}' to color by '{array_name}' ({array_type})."
         return f"Item {item_id} not found."
     
+    def _is_colored_by(self, item: PipelineItem, array_name: str, array_type: str, component: str) -> bool:
+        """Check whether the item's mapper already shows the requested coloring."""
+        current = item.color_by
+        if (current.array_name, current.array_type, current.component) != (array_name, array_type, component):
+            return False
+        
+        mapper = item.actor.GetMapper()
+        if not mapper:
+            return False
+        if current.is_solid_color:
+            return not mapper.GetScalarVisibility()
+        
+        # The colored array may be gone after a time step swap; then it must be rebuilt
+        data = self._full_detail_data(item, mapper)
+        if not data or not mapper.GetScalarVisibility() or not mapper.GetArrayName():
+            return False
+        attributes = data.GetPointData() if array_type == 'POINT' else data.GetCellData()
+        return attributes.GetArray(mapper.GetArrayName()) is not None
+    
     @expose_tool(
         name="set_opacity",
         description=(
@@ -414,6 +1041,8 @@ class PipelineViewModel(QObject):
         """Set actor opacity."""
         item = self._items.get(item_id)
         if item and item.actor:
+            if item.actor.GetProperty().GetOpacity() == opacity:
+                return f"'{item.name}' opacity is already {opacity}."
             self._render_service.set_opacity(item.actor, opacity)
             return f"Set '{item.name}' opacity to {opacity}."
         return f"Item {item_id} not found."
@@ -469,9 +1098,10 @@ class PipelineViewModel(QObject):
         if not item or not item.actor:
             return f"Item {item_id} not found."
             
+        self._detach_placeholder(item)
         success = self._render_service.fit_scalar_range(item.actor)
         if success:
-            self.item_updated.emit(item)
+            self._emit("item_updated", item)
             return f"Rescaled '{item.name}' color range to data bounds."
         return f"Failed to rescale '{item.name}' (maybe not colored by array?)."
 
@@ -493,9 +1123,10 @@ class PipelineViewModel(QObject):
         if not item or not item.actor:
             return f"Item {item_id} not found."
             
+        self._detach_placeholder(item)
         success = self._render_service.set_custom_scalar_range(item.actor, min_val, max_val)
         if success:
-            self.item_updated.emit(item)
+            self._emit("item_updated", item)
             return f"Set '{item.name}' color range to [{min_val}, {max_val}]."
         return f"Failed to set color range for '{item.name}'."
     
@@ -526,10 +1157,7 @@ class PipelineViewModel(QObject):
     
     def get_children(self, item_id: str) -> List[PipelineItem]:
         """Get child items."""
-        return [
-            item for item in self._items.values()
-            if item.parent_id == item_id
-        ]
+        return [self._items[child_id] for child_id in self._children.get(item_id, ())]
     
     def get_root_source_id(self, item_id: str) -> Optional[str]:
         """Get the root source ID for an item by traversing up the parent chain."""
@@ -1,4 +1,5 @@
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QObject, Signal, QTimer, QElapsedTimer, Qt
+from itertools import zip_longest
 from typing import Optional
 from models.pipeline_item import PipelineItem
 from utils.logger import get_logger, log_execution
@@ -8,12 +9,26 @@ logger = get_logger("TimeSeriesMgr")
 
 
 class TimeSeriesManager(QObject):
-    """Manages time series animation and playback."""
+    """
+    Manages time series animation and playback.
+    
+    time_changed is emitted from the playback timer. Subscribers that load
+    data or render should connect with Qt.QueuedConnection so a slow frame
+    does not run inside the timer callback.
+    """
     
     time_changed = Signal(str, int)  # item_id, time_index
     animation_state_changed = Signal(bool, bool)  # is_playing, is_forward
+    prefetch_requested = Signal(str, list)  # item_id, time indices in playback order
+    buffering_changed = Signal(bool)  # True while playback waits for frames to load
     
     DEFAULT_INTERVAL_MS = 100
+    PREFETCH_WINDOW = 20  # Frames requested ahead of the playhead
+    BUFFER_FRAMES = 3  # Frames that must be resident before playback resumes
+    MAX_BUFFER_MS = 2000  # Give up waiting and load synchronously after this long
+    POLL_INTERVAL_MS = 8  # Playhead poll rate; independent of the animation interval
+    PLAYBACK_LOD = 2  # Level of detail while playing; full detail is restored on pause
+    STEP_FRONT_BACK_RATIO = 0.75  # Share of the prefetch window in the direction of a manual step
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -23,8 +38,21 @@ class TimeSeriesManager(QObject):
         self._loop_enabled = False
         self._interval_ms = self.DEFAULT_INTERVAL_MS
         
+        # The playhead is derived from elapsed time; the timer only polls it
         self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(self.POLL_INTERVAL_MS)
         self._timer.timeout.connect(self._on_timer_tick)
+        self._anim_clock = QElapsedTimer()
+        self._anim_steps = 0  # Interval steps already shown since the clock started
+        self._buffering = False
+        self._buffer_clock = QElapsedTimer()
+        self._in_tick = False
+        self._front_back_ratio = 1.0  # Share of the prefetch window after the playhead in time
+        
+        # A loaded series never changes length, so these are fixed per item
+        self._has_time_series = False
+        self._max_index = 0
     
     @property
     def current_item(self) -> Optional[PipelineItem]:
@@ -46,21 +74,24 @@ class TimeSeriesManager(QObject):
     def interval_ms(self) -> int:
         return self._interval_ms
     
+    @property
+    def prefetch_direction(self) -> int:
+        """1 if prefetching favours later time steps, -1 if earlier ones."""
+        return 1 if self._front_back_ratio >= 0.5 else -1
+    
     @property
     def current_index(self) -> int:
-        if self._current_item and self._current_item.is_time_series:
+        if self._has_time_series:
             return self._current_item.current_time_index
         return 0
     
     @property
     def max_index(self) -> int:
-        if self._current_item and self._current_item.is_time_series:
-            return self._current_item.max_time_index
-        return 0
+        return self._max_index
     
     @property
     def has_time_series(self) -> bool:
-        return self._current_item is not None and self._current_item.is_time_series
+        return self._has_time_series
     
     @log_execution(start_msg="Time Series Item Set", end_msg="Time Series Item Setting Completed")
     def set_item(self, item: Optional[PipelineItem]) -> None:
@@ -69,8 +100,11 @@ class TimeSeriesManager(QObject):
             self.pause()
         
         self._current_item = item
+        self._has_time_series = bool(item and item.is_time_series)
+        self._max_index = item.max_time_index if self._has_time_series else 0
         if item:
             logger.info(f"Time series item set: {item.name} (Max index: {item.max_time_index})")
+            self._request_prefetch(self.current_index)
     
     @expose_tool(
         name="set_loop_playback",
@@ -102,7 +136,7 @@ class TimeSeriesManager(QObject):
         old_interval = self._interval_ms
         self._interval_ms = max(10, interval_ms)
         if self._is_playing:
-            self._timer.setInterval(self._interval_ms)
+            self._start_timer()
         
         if old_interval != self._interval_ms:
             logger.info(f"Animation interval set to {self._interval_ms}ms")
@@ -128,12 +162,16 @@ class TimeSeriesManager(QObject):
             self._timer.stop()
         
         self._play_forward = True
+        self._front_back_ratio = 1.0
         
         if self.current_index >= self.max_index and not self._loop_enabled:
             self.go_to_first()
         
+        # Set first so the prefetched frames are reduced in the same background job
+        self._current_item.set_playback_lod(self.PLAYBACK_LOD)
+        self._request_prefetch(self.current_index)
         self._is_playing = True
-        self._timer.start(self._interval_ms)
+        self._start_timer()
         self.animation_state_changed.emit(True, True)
     
     @log_execution(start_msg="Backward Play Started", end_msg="Backward Play activated")
@@ -149,12 +187,16 @@ class TimeSeriesManager(QObject):
             self._timer.stop()
         
         self._play_forward = False
+        self._front_back_ratio = 0.0
         
         if self.current_index <= 0 and not self._loop_enabled:
             self.go_to_last()
         
+        # Set first so the prefetched frames are reduced in the same background job
+        self._current_item.set_playback_lod(self.PLAYBACK_LOD)
+        self._request_prefetch(self.current_index)
         self._is_playing = True
-        self._timer.start(self._interval_ms)
+        self._start_timer()
         self.animation_state_changed.emit(True, False)
     
     @expose_tool(
@@ -173,6 +215,9 @@ class TimeSeriesManager(QObject):
         
         self._is_playing = False
         self._timer.stop()
+        self._set_buffering(False)
+        if self._current_item:
+            self._current_item.set_playback_lod(0)
         self.animation_state_changed.emit(False, self._play_forward)
     
     def toggle_play_forward(self) -> None:
@@ -209,6 +254,7 @@ class TimeSeriesManager(QObject):
             else:
                 return
         
+        self._front_back_ratio = self.STEP_FRONT_BACK_RATIO
         self.set_time_index(new_index)
     
     def step_backward(self) -> None:
@@ -223,6 +269,7 @@ class TimeSeriesManager(QObject):
             else:
                 return
         
+        self._front_back_ratio = 1.0 - self.STEP_FRONT_BACK_RATIO
         self.set_time_index(new_index)
     
     @expose_tool(
@@ -237,35 +284,132 @@ class TimeSeriesManager(QObject):
     )
     @log_execution(level="DEBUG") # Frequent calls, use DEBUG
     def set_time_index(self, index: int) -> None:
-        """Set specific time index."""
-        if not self._current_item or not self._current_item.is_time_series:
+        """
+        Set specific time index.
+        
+        The item itself is updated by the pipeline view model in response to
+        time_changed, since the step may first need to be loaded from disk.
+        """
+        if not self._has_time_series:
             return
         
-        if self._current_item.set_time_index(index):
-            self.time_changed.emit(self._current_item.id, self._current_item.current_time_index)
+        index = max(0, min(index, self._max_index))
+        if index != self._current_item.current_time_index:
+            self.time_changed.emit(self._current_item.id, index)
+            self._request_prefetch(index)
+    
+    def _steps_from(self, index: int, step: int, count: int) -> list[int]:
+        """Indices of the next count frames after index, moving by step."""
+        total = self._max_index + 1
+        indices = [index + step * offset for offset in range(1, min(count, total - 1) + 1)]
+        if self._loop_enabled:
+            return [i % total for i in indices]
+        return [i for i in indices if 0 <= i < total]
+    
+    def _window(self, index: int, count: int) -> list[int]:
+        """Indices of the next count frames after index in the playback direction."""
+        return self._steps_from(index, 1 if self._play_forward else -1, count)
+    
+    def _prefetch_window(self, index: int) -> list[int]:
+        """Frames around index to prefetch, split by the front/back ratio, nearest first."""
+        count = min(self.PREFETCH_WINDOW, self._max_index)
+        ahead = round(count * self._front_back_ratio)
+        later = self._steps_from(index, 1, ahead)
+        earlier = self._steps_from(index, -1, count - ahead)
+        nearest_first = [i for pair in zip_longest(later, earlier) for i in pair if i is not None]
+        # Looping windows can overlap once they wrap around
+        return list(dict.fromkeys(nearest_first))
+    
+    def _request_prefetch(self, index: int) -> None:
+        """Ask for the frames playback will reach next to be loaded in the background."""
+        if self._has_time_series:
+            self.prefetch_requested.emit(self._current_item.id, self._prefetch_window(index))
+    
+    def _is_resident(self, index: int) -> bool:
+        return self._current_item.time_steps[index] is not None
+    
+    def _set_buffering(self, buffering: bool) -> None:
+        if buffering != self._buffering:
+            self._buffering = buffering
+            self.buffering_changed.emit(buffering)
+    
+    def _should_wait_for(self, index: int) -> bool:
+        """
+        Decide whether playback should hold before showing index.
+        
+        On a miss playback buffers until BUFFER_FRAMES frames are resident, so
+        it does not stall again on the very next tick.
+        """
+        if self._buffering:
+            needed = [index] + self._window(index, self.BUFFER_FRAMES - 1)
+            ready = all(self._is_resident(i) for i in needed)
+        else:
+            ready = self._is_resident(index)
+        
+        if ready or (self._buffering and self._buffer_clock.hasExpired(self.MAX_BUFFER_MS)):
+            self._set_buffering(False)
+            return False
+        
+        if not self._buffering:
+            self._set_buffering(True)
+            self._buffer_clock.start()
+            self._request_prefetch(self.current_index)
+        return True
+    
+    def _start_timer(self) -> None:
+        """Anchor the animation clock at the current step and start polling."""
+        self._anim_clock.start()
+        self._anim_steps = 0
+        self._timer.start()
     
     def _on_timer_tick(self) -> None:
-        """Handle timer tick for animation."""
-        if not self.has_time_series:
+        """
+        Advance the playhead to where elapsed time says it should be.
+        
+        Steps that are overdue (e.g. after a slow render) are skipped rather
+        than played late, so playback speed does not depend on render cost.
+        """
+        # A handler that spins the event loop could re-enter; the elapsed-time
+        # catch-up on the next tick covers the skipped one
+        if self._in_tick:
+            return
+        
+        self._in_tick = True
+        try:
+            self._advance_playhead()
+        finally:
+            self._in_tick = False
+    
+    def _advance_playhead(self) -> None:
+        """Show the step the animation clock has reached, if it is ready."""
+        if not self._has_time_series:
             self.pause()
             return
         
-        if self._play_forward:
-            new_index = self.current_index + 1
-            if new_index > self.max_index:
-                if self._loop_enabled:
-                    new_index = 0
-                else:
-                    self.pause()
-                    return
-        else:
-            new_index = self.current_index - 1
-            if new_index < 0:
-                if self._loop_enabled:
-                    new_index = self.max_index
-                else:
-                    self.pause()
-                    return
+        steps = self._anim_clock.elapsed() // self._interval_ms
+        if steps <= self._anim_steps:
+            return
+        
+        delta = steps - self._anim_steps
+        max_index = self._max_index
+        current = self._current_item.current_time_index
+        new_index = current + delta if self._play_forward else current - delta
+        if self._loop_enabled:
+            new_index %= max_index + 1
+        elif not 0 <= new_index <= max_index:
+            end = max_index if self._play_forward else 0
+            if current == end:
+                self.pause()
+                return
+            new_index = end
+        
+        was_buffering = self._buffering
+        if self._should_wait_for(new_index):
+            return
         
         self.set_time_index(new_index)
-
+        if was_buffering:
+            # Restart the clock so time spent buffering is not skipped over
+            self._start_timer()
+        else:
+            self._anim_steps = steps
@@ -1,11 +1,15 @@
-from PySide6.QtCore import QObject, Signal, QEventLoop, QTimer
-from typing import Tuple, List, Any, Optional
+import sys
+import threading
+from PySide6.QtCore import QObject, Signal, QTimer, QThread, QCoreApplication
+from typing import Tuple, List, Any, Optional, Callable
 from services.vtk_render_service import VTKRenderService
 from utils.logger import get_logger
 from utils.tool_registry import expose_tool
 
 logger = get_logger("VTKVM")
 
+_CUSTOM_BACKGROUND = sys.intern("Custom")
+
 
 class VTKViewModel(QObject):
     """ViewModel for VTK viewer state management."""
@@ -29,7 +33,11 @@ class VTKViewModel(QObject):
     camera_state_changed = Signal(dict)
     camera_apply_requested = Signal(dict)
     
-    BACKGROUND_PRESETS = [
+    _render_coalesce_requested = Signal()
+    _camera_read_requested = Signal(object)  # threading.Event set once the GUI thread has read the camera
+    
+    # Immutable, with interned names so lookups by menu text compare by identity
+    BACKGROUND_PRESETS = tuple((sys.intern(name), c1, c2) for name, c1, c2 in (
         ("Warm Gray (Default)", (0.32, 0.34, 0.43), None),
         ("Blue Gray", (0.2, 0.3, 0.4), None),
         ("Dark Gray", (0.1, 0.1, 0.1), None),
@@ -38,15 +46,30 @@ class VTKViewModel(QObject):
         ("White", (1.0, 1.0, 1.0), None),
         ("Black", (0.0, 0.0, 0.0), None),
         ("Gradient Background", (0.32, 0.34, 0.43), (0.0, 0.0, 0.0)),
-    ]
+    ))
+    
+    _PRESET_MAP = {name: (c1, c2) for name, c1, c2 in BACKGROUND_PRESETS}
     
-    REPRESENTATION_STYLES = ["Points", "Point Gaussian", "Wireframe", "Surface", "Surface With Edges"]
+    REPRESENTATION_STYLES = tuple(sys.intern(style) for style in (
+        "Points", "Point Gaussian", "Wireframe", "Surface", "Surface With Edges"
+    ))
     
     def __init__(self, render_service: VTKRenderService):
         super().__init__()
         self._render_service = render_service
         self._current_background = self.BACKGROUND_PRESETS[0]
         self._last_camera_state = {}
+        self._plane_preview: Optional[tuple] = None  # (origin, normal, bounds) shown; None while hidden
+        self._camera_state_provider: Optional[Callable[[], dict]] = None
+        
+        # Render requests within one event-loop pass collapse into a single render.
+        # Armed through a signal so requests from the agent thread start the timer on the GUI thread.
+        self._render_coalesce_timer = QTimer(self)
+        self._render_coalesce_timer.setSingleShot(True)
+        self._render_coalesce_timer.setInterval(0)
+        self._render_coalesce_timer.timeout.connect(self.render_requested.emit)
+        self._render_coalesce_requested.connect(self._render_coalesce_timer.start)
+        self._camera_read_requested.connect(self._read_camera_state)
     
     @property
     def render_service(self) -> VTKRenderService:
@@ -55,17 +78,20 @@ class VTKViewModel(QObject):
     def set_background(self, col1: str, col2: str) -> None:
         """Set background gradient colors."""
         self._render_service.set_background(col1, col2)
+        self._current_background = (_CUSTOM_BACKGROUND, col1, col2)
         logger.info(f"Background Set: {col1}, {col2}")
         self.background_changed.emit(col1, col2)
     
     def set_background_preset(self, preset_name: str) -> None:
         """Set background from preset."""
-        for name, c1, c2 in self.BACKGROUND_PRESETS:
-            if name == preset_name:
-                self._current_background = (name, c1, c2)
-                self.background_changed.emit(c1, c2)
-                logger.info(f"Background preset changed: {preset_name}")
-                break
+        if preset_name == self._current_background[0]:
+            return
+        entry = self._PRESET_MAP.get(preset_name)
+        if entry:
+            c1, c2 = entry
+            self._current_background = (preset_name, c1, c2)
+            self.background_changed.emit(c1, c2)
+            logger.info(f"Background preset changed: {preset_name}")
     
     @expose_tool(
         name="reset_camera_view",
@@ -103,19 +129,22 @@ class VTKViewModel(QObject):
     def add_actor(self, actor: Any) -> None:
         """Request actor to be added to renderer."""
         self.actor_added.emit(actor)
-        self.render_requested.emit()
+        self.request_render()
         logger.info(f"Actor added: {id(actor)}")
     
     def remove_actor(self, actor: Any) -> None:
         """Request actor to be removed from renderer."""
         self.actor_removed.emit(actor)
-        self.render_requested.emit()
+        self.request_render()
         logger.info(f"Actor removed: {id(actor)}")
     
     def set_actor_visibility(self, actor: Any, visible: bool) -> None:
         """Request actor visibility change."""
+        # The actor itself is the source of truth; it may have been toggled directly
+        if bool(actor.GetVisibility()) == visible:
+            return
         self.actor_visibility_changed.emit(actor, visible)
-        self.render_requested.emit()
+        self.request_render()
         logger.info(f"Actor visibility set to {visible}: {id(actor)}")
     
     def clear_scene(self) -> None:
@@ -124,16 +153,23 @@ class VTKViewModel(QObject):
         logger.info("Clear scene requested")
     
     def request_render(self) -> None:
-        """Request a render update."""
-        self.render_requested.emit()
+        """Request a render update, coalesced with other requests in the same event-loop pass."""
+        self._render_coalesce_requested.emit()
     
     def show_plane_preview(self, origin: List[float], normal: List[float], 
                            bounds: Tuple[float, ...]) -> None:
-        """Request plane preview display."""
+        """Request plane preview display, skipping it if that exact plane is already shown."""
+        state = (tuple(origin), tuple(normal), tuple(bounds) if bounds else None)
+        if state == self._plane_preview:
+            return
+        self._plane_preview = state
         self.plane_preview_requested.emit(origin, normal, bounds)
     
     def hide_plane_preview(self) -> None:
-        """Request to hide plane preview."""
+        """Request to hide plane preview, unless it is already hidden."""
+        if self._plane_preview is None:
+            return
+        self._plane_preview = None
         self.plane_preview_hide_requested.emit()
     
     def update_scalar_bar(self, actor: Any) -> None:
@@ -147,7 +183,7 @@ class VTKViewModel(QObject):
     def set_legend_settings(self, settings: dict) -> None:
         """Request legend settings update."""
         self.legend_settings_changed.emit(settings)
-        self.render_requested.emit()
+        self.request_render()
         logger.info("Legend settings updated")
     
     def request_camera_query(self) -> None:
@@ -159,35 +195,35 @@ class VTKViewModel(QObject):
         self._last_camera_state = state
         self.camera_state_changed.emit(state)
         
+    def set_camera_state_provider(self, provider: Callable[[], dict]) -> None:
+        """Register a direct camera state getter (the view owns the renderer)."""
+        self._camera_state_provider = provider
+    
     def get_camera_state_sync(self, timeout_ms: int = 1000) -> dict:
-        """Get the current camera state synchronously using a local event loop."""
-        loop = QEventLoop()
-        result_captured = [False]
-        state_data = {}
-
-        def on_state(state):
-            nonlocal state_data
-            state_data = state
-            result_captured[0] = True
-            loop.quit()
-
-        self.camera_state_changed.connect(on_state)
-        self.camera_query_requested.emit()
-        
-        # Use a timer for timeout
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(loop.quit)
-        timer.start(timeout_ms)
-
-        loop.exec()
+        """
+        Get the current camera state synchronously.
         
-        self.camera_state_changed.disconnect(on_state)
-        
-        if result_captured[0]:
-            return state_data
-        return self._last_camera_state  # Return cached state if timeout
-
+        On the GUI thread the view is read directly. Other threads (agent tools)
+        queue the read to the GUI thread, since only it may touch the renderer,
+        and wait at most timeout_ms. The last known state is returned if it does
+        not answer in time, e.g. while the application is shutting down.
+        """
+        if QThread.currentThread() is self.thread():
+            self._read_camera_state()
+        elif not QCoreApplication.closingDown():
+            done = threading.Event()
+            self._camera_read_requested.emit(done)
+            if not done.wait(timeout_ms / 1000):
+                logger.warning("Camera state request timed out; using the last known state")
+        return self._last_camera_state
+    
+    def _read_camera_state(self, done: Optional[threading.Event] = None) -> None:
+        """Refresh the cached camera state from the view (GUI thread)."""
+        if self._camera_state_provider:
+            self._last_camera_state = self._camera_state_provider()
+        if done is not None:
+            done.set()
+    
     @expose_tool(
         name="get_camera_state",
         description=(
@@ -1,4 +1,28 @@
-# Views are imported where needed to avoid circular imports
-# Usage: from views.main_window import MainWindow
+# Views are imported lazily on first attribute access, so `import views` stays cheap
+# and does not pull in VTK or Qt widgets (or trigger circular imports).
+# Usage: from views.main_window import MainWindow  or  from views import MainWindow
+import importlib
 
 __all__ = ["MainWindow", "VTKWidget", "PipelineBrowserWidget", "PropertiesPanel", "ChatPanel"]
+
+_LAZY_MODULES = {
+    "MainWindow": ".main_window",
+    "VTKWidget": ".vtk_widget",
+    "PipelineBrowserWidget": ".pipeline_browser",
+    "PropertiesPanel": ".properties_panel",
+    "ChatPanel": ".chat_panel",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
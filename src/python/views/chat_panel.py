@@ -1,3 +1,6 @@
+from collections import deque
+from html import escape
+import functools
 import markdown
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
@@ -6,6 +9,97 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QCursor
+from typing import Optional
+
+try:
+    import mistune
+except ImportError:
+    mistune = None
+
+# mistune is several times faster than markdown; use it when installed.
+# hard_wrap matches markdown's nl2br; fenced code is built in.
+_fast_markdown = (
+    mistune.create_markdown(escape=False, hard_wrap=True, plugins=["table", "strikethrough"])
+    if mistune else None
+)
+
+# Reused instead of building a Markdown instance and its extensions per call.
+# Not thread-safe; chat rendering only happens on the GUI thread.
+_markdown = markdown.Markdown(extensions=['fenced_code', 'tables', 'nl2br'])
+
+
+# Sender -> bubbleKind property value; any other sender is styled as "other"
+_BUBBLE_KINDS = {"User": "user", "System": "system"}
+
+# Set once on ChatPanel; bubbles select a style through their bubbleKind property
+_BUBBLE_QSS = """
+    QFrame[bubbleKind="user"], QFrame[bubbleKind="user"] QLabel {
+        background-color: #0084ff;
+        border-radius: 12px;
+        padding: 8px 12px;
+    }
+    QFrame[bubbleKind="system"], QFrame[bubbleKind="system"] QLabel {
+        background-color: #e0e0e0;
+        border-radius: 12px;
+        padding: 8px 12px;
+    }
+    QFrame[bubbleKind="other"], QFrame[bubbleKind="other"] QLabel {
+        background-color: #f0f0f0;
+        border-radius: 12px;
+        padding: 8px 12px;
+    }
+    QFrame[bubbleKind] QLabel#bubbleContent {
+        color: #000000;
+        font-size: 13px;
+    }
+    QFrame[bubbleKind="user"] QLabel#bubbleContent {
+        color: #ffffff;
+    }
+    QFrame[bubbleKind] QLabel#bubbleSender {
+        color: #666666;
+        font-size: 11px;
+        font-weight: bold;
+    }
+"""
+
+
+# Only properties Qt's rich text engine supports; it ignores border-radius and overflow
+_MD_CSS = """
+    code {
+        background-color: #e8e8e8;
+        padding: 2px 5px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 12px;
+    }
+    pre {
+        background-color: #e8e8e8;
+        padding: 8px;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 12px;
+    }
+    ul, ol {
+        margin: 4px 0;
+        padding-left: 20px;
+    }
+    p {
+        margin: 4px 0;
+    }
+"""
+# Whitespace collapsed so each label update hands Qt as little CSS to parse as possible
+_MD_STYLE_PREFIX = "<style>" + " ".join(_MD_CSS.split()) + "</style>"
+
+
+@functools.lru_cache(maxsize=128)
+def _markdown_to_html(content: str) -> str:
+    """Convert markdown to unstyled HTML, memoized across bubbles."""
+    if _fast_markdown is not None:
+        return _fast_markdown(content)
+    return _markdown.reset().convert(content)
+
+
+def _style_html(html: str) -> str:
+    """Wrap rendered markdown with the chat's code/list styling."""
+    return _MD_STYLE_PREFIX + html
 
 
 class CollapsibleToolSection(QFrame):
@@ -14,7 +108,9 @@ class CollapsibleToolSection(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._collapsed = True
-        self._activities = []
+        self._activities = []  # (tool name, result, in progress)
+        self._activity_labels = []  # QLabel per entry in _activities
+        self._pending_by_tool: dict[str, list[int]] = {}  # tool name -> in-progress indices, oldest first
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -74,9 +170,9 @@ class CollapsibleToolSection(QFrame):
             return
         
         arrow = "▶" if self._collapsed else "▼"
-        last_tool, last_result = self._activities[-1]
+        last_tool, _, last_in_progress = self._activities[-1]
         
-        if "호출 중" in last_result:
+        if last_in_progress:
             status = f"{last_tool} 호출 중..."
         else:
             status = f"{last_tool} 완료"
@@ -84,56 +180,48 @@ class CollapsibleToolSection(QFrame):
         self._header.setText(f"{arrow} Tool 활동 ({count}개) - {status}")
     
     def add_activity(self, tool_name: str, result: str) -> None:
-        for i, (name, old_result) in enumerate(self._activities):
-            if name == tool_name and "호출 중" in old_result:
-                self._activities[i] = (tool_name, result)
-                self._update_details()
-                self._update_header()
-                return
+        in_progress = "호출 중" in result
+        text = self._format_activity(tool_name, result, in_progress)
+        
+        pending = self._pending_by_tool.get(tool_name)
+        if pending:
+            # The oldest in-progress call of this tool is the one that finished
+            i = pending.pop(0)
+            if not pending:
+                del self._pending_by_tool[tool_name]
+            self._activities[i] = (tool_name, result, in_progress)
+            self._activity_labels[i].setText(text)
+            if in_progress:
+                self._pending_by_tool.setdefault(tool_name, []).insert(0, i)
+            self._update_header()
+            return
         
-        self._activities.append((tool_name, result))
+        if in_progress:
+            self._pending_by_tool.setdefault(tool_name, []).append(len(self._activities))
+        self._activities.append((tool_name, result, in_progress))
         
         activity_label = QLabel()
         activity_label.setWordWrap(True)
         activity_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        
-        if "호출 중" in result:
-            text = f"<span style='color: #888;'>⏳ {tool_name}: {result}</span>"
-        else:
-            preview = result[:80] + "..." if len(result) > 80 else result
-            preview = preview.replace('\n', ' ')
-            text = f"<span style='color: #555;'>✓ {tool_name}: {preview}</span>"
-        
         activity_label.setText(text)
         activity_label.setStyleSheet("font-size: 11px;")
         self._detail_layout.addWidget(activity_label)
+        self._activity_labels.append(activity_label)
         
         self._update_header()
     
-    def _update_details(self) -> None:
-        while self._detail_layout.count():
-            item = self._detail_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        for tool_name, result in self._activities:
-            activity_label = QLabel()
-            activity_label.setWordWrap(True)
-            activity_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-            
-            if "호출 중" in result:
-                text = f"<span style='color: #888;'>⏳ {tool_name}: {result}</span>"
-            else:
-                preview = result[:80] + "..." if len(result) > 80 else result
-                preview = preview.replace('\n', ' ')
-                text = f"<span style='color: #555;'>✓ {tool_name}: {preview}</span>"
-            
-            activity_label.setText(text)
-            activity_label.setStyleSheet("font-size: 11px;")
-            self._detail_layout.addWidget(activity_label)
+    @staticmethod
+    def _format_activity(tool_name: str, result: str, in_progress: bool) -> str:
+        if in_progress:
+            return f"<span style='color: #888;'>⏳ {tool_name}: {result}</span>"
+        preview = result[:80] + "..." if len(result) > 80 else result
+        preview = preview.replace('\n', ' ')
+        return f"<span style='color: #555;'>✓ {tool_name}: {preview}</span>"
     
     def clear(self) -> None:
         self._activities.clear()
+        self._activity_labels.clear()
+        self._pending_by_tool.clear()
         while self._detail_layout.count():
             item = self._detail_layout.takeAt(0)
             if item.widget():
@@ -146,126 +234,140 @@ class MessageBubble(QFrame):
     
     def __init__(self, sender: str, content: str = "", parent=None):
         super().__init__(parent)
-        self._sender = sender
-        self._content_label = None
-        self._is_user = sender == "User"
-        self._setup_ui(sender, content)
+        self._sender = None
+        self._is_user = False
+        self._kind = None
+        # Streaming: HTML of the closed markdown blocks, and the source they came from
+        self._stream_prefix_src = ""
+        self._stream_prefix_html = ""
+        self._streamed_src = None  # Last text passed to stream_content()
+        self._pending_markdown = None  # Raw markdown shown as plain text until rendered
+        self._setup_ui()
+        self.reconfigure(sender, content)
     
-    def _setup_ui(self, sender: str, content: str) -> None:
-        is_user = self._is_user
-        is_system = sender == "System"
-        
+    def _setup_ui(self) -> None:
         self.setFrameShape(QFrame.Shape.NoFrame)
         
-        outer_layout = QHBoxLayout(self)
-        outer_layout.setContentsMargins(8, 4, 8, 4)
+        self._outer_layout = QHBoxLayout(self)
+        self._outer_layout.setContentsMargins(8, 4, 8, 4)
         
-        if is_user:
-            outer_layout.addStretch()
+        self._bubble = QFrame()
+        self._bubble.setFrameShape(QFrame.Shape.StyledPanel)
+        self._bubble.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Minimum)
+        self._bubble.setMaximumWidth(400)
         
-        bubble = QFrame()
-        bubble.setFrameShape(QFrame.Shape.StyledPanel)
-        bubble.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Minimum)
-        bubble.setMaximumWidth(400)
-        
-        if is_user:
-            bubble.setStyleSheet("""
-                QFrame {
-                    background-color: #0084ff;
-                    border-radius: 12px;
-                    padding: 8px 12px;
-                }
-            """)
-        elif is_system:
-            bubble.setStyleSheet("""
-                QFrame {
-                    background-color: #e0e0e0;
-                    border-radius: 12px;
-                    padding: 8px 12px;
-                }
-            """)
-        else:
-            bubble.setStyleSheet("""
-                QFrame {
-                    background-color: #f0f0f0;
-                    border-radius: 12px;
-                    padding: 8px 12px;
-                }
-            """)
-        
-        bubble_layout = QVBoxLayout(bubble)
+        bubble_layout = QVBoxLayout(self._bubble)
         bubble_layout.setContentsMargins(0, 0, 0, 0)
         bubble_layout.setSpacing(4)
         
-        if not is_user:
-            sender_label = QLabel(sender)
-            sender_label.setStyleSheet("color: #666666; font-size: 11px; font-weight: bold;")
-            bubble_layout.addWidget(sender_label)
+        self._sender_label = QLabel()
+        self._sender_label.setObjectName("bubbleSender")
+        bubble_layout.addWidget(self._sender_label)
         
         self._content_label = QLabel()
+        self._content_label.setObjectName("bubbleContent")
         self._content_label.setWordWrap(True)
         self._content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         self._content_label.setOpenExternalLinks(True)
-        
-        if is_user:
-            self._content_label.setText(content)
-            self._content_label.setStyleSheet("color: #ffffff; font-size: 13px;")
-        else:
-            self._content_label.setTextFormat(Qt.TextFormat.RichText)
-            self._content_label.setStyleSheet("color: #000000; font-size: 13px;")
-            if content:
-                self._content_label.setText(self._render_markdown(content))
-        
         bubble_layout.addWidget(self._content_label)
         
-        outer_layout.addWidget(bubble)
+        self._outer_layout.addWidget(self._bubble)
+    
+    def reconfigure(self, sender: str, content: str = "") -> None:
+        """Re-target this bubble to a new message, reusing its widgets."""
+        self._stream_prefix_src = ""
+        self._stream_prefix_html = ""
+        self._streamed_src = None
+        if sender != self._sender:
+            self._sender = sender
+            self._is_user = sender == "User"
+            
+            kind = _BUBBLE_KINDS.get(sender, "other")
+            if kind != self._kind:
+                self._kind = kind
+                self._bubble.setProperty("bubbleKind", kind)
+                # Property selectors are only re-evaluated on polish
+                for widget in (self._bubble, self._sender_label, self._content_label):
+                    widget.style().unpolish(widget)
+                    widget.style().polish(widget)
+                self._content_label.setTextFormat(
+                    Qt.TextFormat.AutoText if self._is_user else Qt.TextFormat.RichText
+                )
+            
+            self._sender_label.setText(sender)
+            self._sender_label.setVisible(not self._is_user)
+            alignment = Qt.AlignmentFlag.AlignRight if self._is_user else Qt.AlignmentFlag.AlignLeft
+            self._outer_layout.setAlignment(self._bubble, alignment)
         
-        if not is_user:
-            outer_layout.addStretch()
+        if self._is_user or not content:
+            self._pending_markdown = None
+            self._content_label.setText(content)
+        else:
+            # Markdown is rendered by ensure_rendered() once the bubble scrolls into view;
+            # until then the escaped source keeps the bubble close to its final size
+            self._pending_markdown = content
+            self._content_label.setText(escape(content).replace("\n", "<br>"))
+    
+    def clear_content(self) -> None:
+        """Drop the displayed text, e.g. while the bubble waits in a pool."""
+        self._pending_markdown = None
+        self._streamed_src = None
+        self._stream_prefix_src = ""
+        self._stream_prefix_html = ""
+        self._content_label.clear()
+    
+    def ensure_rendered(self) -> None:
+        """Render deferred markdown content, if any."""
+        if self._pending_markdown is not None:
+            self._content_label.setText(self._render_markdown(self._pending_markdown))
+            self._pending_markdown = None
     
     def update_content(self, content: str) -> None:
         """Update the message content (for streaming)."""
-        if self._content_label:
-            if self._is_user:
-                self._content_label.setText(content)
-            else:
-                self._content_label.setText(self._render_markdown(content))
+        self._pending_markdown = None
+        self._streamed_src = None
+        if self._is_user:
+            self._content_label.setText(content)
+        else:
+            self._content_label.setText(self._render_markdown(content))
+    
+    def stream_content(self, content: str) -> None:
+        """
+        Update the content of a message that is still streaming.
+        
+        Markdown blocks closed by a blank line outside a code fence are
+        rendered once and kept; only the open trailing block is re-rendered.
+        Call update_content() with the final text to render it as a whole.
+        """
+        self._pending_markdown = None
+        if content == self._streamed_src:
+            return
+        self._streamed_src = content
+        if self._is_user:
+            self._content_label.setText(content)
+            return
+        
+        if not content.startswith(self._stream_prefix_src):
+            self._stream_prefix_src = ""
+            self._stream_prefix_html = ""
+        
+        start = len(self._stream_prefix_src)
+        split = content.rfind("\n\n", start)
+        # A blank line inside an open code fence does not close a block
+        while split > start and content.count("```", start, split) % 2:
+            split = content.rfind("\n\n", start, split)
+        
+        if split > start:
+            self._stream_prefix_html += _markdown_to_html(content[start:split])
+            self._stream_prefix_src = content[:split]
+            start = split
+        
+        html = self._stream_prefix_html + _markdown_to_html(content[start:])
+        self._content_label.setText(_style_html(html))
     
     def _render_markdown(self, content: str) -> str:
         """Convert markdown to styled HTML."""
-        html = markdown.markdown(
-            content,
-            extensions=['fenced_code', 'tables', 'nl2br']
-        )
-        
-        styled_html = f"""
-        <style>
-            code {{
-                background-color: #e8e8e8;
-                padding: 2px 5px;
-                border-radius: 3px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
-            }}
-            pre {{
-                background-color: #e8e8e8;
-                padding: 8px;
-                border-radius: 6px;
-                overflow-x: auto;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
-            }}
-            ul, ol {{
-                margin: 4px 0;
-                padding-left: 20px;
-            }}
-            p {{
-                margin: 4px 0;
-            }}
-        </style>
-        {html}
-        """
-        return styled_html
+        return _style_html(_markdown_to_html(content))
 
 
 class InputFormBubble(QFrame):
@@ -403,16 +505,44 @@ class ChatPanel(QWidget):
     new_conversation_requested = Signal()
     cancel_requested = Signal()
     
+    BUBBLE_POOL_SIZE = 200
+    MAX_DISPLAYED_WIDGETS = 1000  # Oldest entries are dropped beyond this scrollback
+    SCROLL_DELAY_MS = 10  # Lets the message layout settle before reading the scroll range
+    STREAM_REFRESH_MS = 33  # Streaming text is redrawn at most this often (~30 Hz)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._bubble_pool: deque[MessageBubble] = deque()
         self._streaming_bubble = None
         self._streaming_content = ""
         self._current_tool_section = None
         self._is_waiting_for_input = False
+        
+        # Bursts of scroll requests collapse into one scroll once the layout is updated
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(self.SCROLL_DELAY_MS)
+        self._scroll_timer.timeout.connect(self._apply_scroll_to_bottom)
+        
+        # Tokens arriving between refreshes only update _streaming_content
+        self._stream_dirty = False
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.setInterval(self.STREAM_REFRESH_MS)
+        self._stream_timer.timeout.connect(self._on_stream_timer)
+        
+        # Bubbles render their markdown lazily, once per scroll/layout change at most
+        self._lazy_render_timer = QTimer(self)
+        self._lazy_render_timer.setSingleShot(True)
+        self._lazy_render_timer.setInterval(0)
+        self._lazy_render_timer.timeout.connect(self._render_visible_bubbles)
+        
         self._setup_ui()
     
     def _setup_ui(self) -> None:
         """Setup the chat panel UI."""
+        self.setStyleSheet(_BUBBLE_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -426,11 +556,15 @@ class ChatPanel(QWidget):
         self._messages_layout = QVBoxLayout(self._messages_container)
         self._messages_layout.setContentsMargins(0, 8, 0, 8)
         self._messages_layout.setSpacing(2)
-        self._messages_layout.addStretch()
+        self._messages_layout.addStretch()  # Keeps messages packed at the top; always the last item
         
         self._scroll_area.setWidget(self._messages_container)
         layout.addWidget(self._scroll_area)
         
+        scroll_bar = self._scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(lambda _: self._lazy_render_timer.start())
+        scroll_bar.rangeChanged.connect(lambda _min, _max: self._lazy_render_timer.start())
+        
         # Button bar layout
         button_container = QWidget()
         button_layout = QHBoxLayout(button_container)
@@ -473,7 +607,7 @@ class ChatPanel(QWidget):
         self._current_chat_vm = chat_vm
         form = InputFormBubble(description, fields)
         form.submitted.connect(self._on_form_submitted)
-        self._messages_layout.insertWidget(self._messages_layout.count() - 1, form)
+        self._add_message_widget(form)
         self._scroll_to_bottom()
         self._is_waiting_for_input = True
         self.set_input_enabled(False)
@@ -525,39 +659,89 @@ class ChatPanel(QWidget):
     
     def append_message(self, sender: str, content: str) -> None:
         """Append a message bubble to the display."""
-        bubble = MessageBubble(sender, content)
-        self._messages_layout.insertWidget(self._messages_layout.count() - 1, bubble)
+        bubble = self._acquire_bubble(sender, content)
+        self._add_message_widget(bubble)
         self._scroll_to_bottom()
     
+    def _add_message_widget(self, widget: QWidget, before: Optional[QWidget] = None) -> None:
+        """
+        Add a widget to the message list, trimming the oldest beyond the scrollback limit.
+        
+        Args:
+            widget: Message widget to add
+            before: Existing message widget to insert in front of; None appends
+        """
+        index = self._messages_layout.indexOf(before) if before is not None else -1
+        if index < 0:
+            index = self._messages_layout.count() - 1  # In front of the trailing stretch
+        self._messages_layout.insertWidget(index, widget)
+        self._lazy_render_timer.start()
+        
+        # The trailing stretch is not a message widget
+        while self._messages_layout.count() - 1 > self.MAX_DISPLAYED_WIDGETS:
+            oldest = self._messages_layout.itemAt(0).widget()
+            if oldest is self._streaming_bubble or oldest is self._current_tool_section:
+                break
+            self._messages_layout.takeAt(0)
+            self._release_widget(oldest)
+    
+    def _release_widget(self, widget: QWidget) -> None:
+        """Return a bubble to the pool, or delete any other message widget."""
+        if isinstance(widget, MessageBubble) and len(self._bubble_pool) < self.BUBBLE_POOL_SIZE:
+            widget.setParent(None)
+            widget.clear_content()
+            self._bubble_pool.append(widget)
+        else:
+            widget.deleteLater()
+    
+    def _acquire_bubble(self, sender: str, content: str) -> MessageBubble:
+        """Take a bubble from the pool, or create one if the pool is empty."""
+        if self._bubble_pool:
+            bubble = self._bubble_pool.pop()
+            bubble.reconfigure(sender, content)
+            return bubble
+        return MessageBubble(sender, content)
+    
     def start_streaming(self) -> None:
         """Start a streaming message bubble."""
         self._streaming_content = ""
         self._current_tool_section = None
-        self._streaming_bubble = MessageBubble("Agent", "▌")
-        self._messages_layout.insertWidget(self._messages_layout.count() - 1, self._streaming_bubble)
+        self._streaming_bubble = self._acquire_bubble("Agent", "▌")
+        self._add_message_widget(self._streaming_bubble)
         self._scroll_to_bottom()
     
     def add_tool_activity(self, tool_name: str, result: str) -> None:
         """Add a tool activity to the current tool section."""
         if self._current_tool_section is None:
             self._current_tool_section = CollapsibleToolSection()
-            insert_pos = self._messages_layout.count() - 1
-            if self._streaming_bubble:
-                insert_pos -= 1
-            self._messages_layout.insertWidget(insert_pos, self._current_tool_section)
+            self._add_message_widget(self._current_tool_section, before=self._streaming_bubble)
         
         self._current_tool_section.add_activity(tool_name, result)
         self._scroll_to_bottom()
     
     def update_streaming(self, content: str) -> None:
         """Update the streaming message content."""
-        if self._streaming_bubble:
+        if self._streaming_bubble and content != self._streaming_content:
             self._streaming_content = content
-            self._streaming_bubble.update_content(content + "▌")
-            self._scroll_to_bottom()
+            self._stream_dirty = True
+            if not self._stream_timer.isActive():
+                self._flush_stream()
+    
+    def _flush_stream(self) -> None:
+        """Draw the latest streamed content and hold further redraws for one refresh interval."""
+        self._stream_dirty = False
+        self._streaming_bubble.stream_content(self._streaming_content + "▌")
+        self._scroll_to_bottom()
+        self._stream_timer.start()
+    
+    def _on_stream_timer(self) -> None:
+        if self._stream_dirty and self._streaming_bubble:
+            self._flush_stream()
     
     def finish_streaming(self) -> None:
         """Finish streaming and finalize the message."""
+        self._stream_timer.stop()
+        self._stream_dirty = False
         if self._streaming_bubble and self._streaming_content:
             self._streaming_bubble.update_content(self._streaming_content)
         self._streaming_bubble = None
@@ -565,15 +749,47 @@ class ChatPanel(QWidget):
         self._current_tool_section = None
     
     def _scroll_to_bottom(self) -> None:
-        """Scroll to the bottom of the chat."""
-        QTimer.singleShot(10, lambda: self._scroll_area.verticalScrollBar().setValue(
-            self._scroll_area.verticalScrollBar().maximum()
-        ))
+        """Schedule a scroll to the bottom of the chat."""
+        if not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+    
+    def _apply_scroll_to_bottom(self) -> None:
+        scroll_bar = self._scroll_area.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+    
+    def _render_visible_bubbles(self) -> None:
+        """Render markdown for bubbles within one viewport height of the visible area."""
+        viewport_height = self._scroll_area.viewport().height()
+        top = self._scroll_area.verticalScrollBar().value() - viewport_height
+        bottom = top + 3 * viewport_height
+        
+        # Widgets are stacked top to bottom, so binary-search the first one reaching `top`
+        layout = self._messages_layout
+        lo, hi = 0, layout.count() - 1  # The trailing stretch is not a message widget
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if layout.itemAt(mid).widget().geometry().bottom() < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        for index in range(lo, layout.count() - 1):
+            widget = layout.itemAt(index).widget()
+            if widget.y() > bottom:
+                break
+            if isinstance(widget, MessageBubble):
+                widget.ensure_rendered()
     
     def clear_display(self) -> None:
         """Clear the chat display."""
+        self._stream_timer.stop()
         self._streaming_bubble = None
-        while self._messages_layout.count() > 1:
-            item = self._messages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._messages_container.setUpdatesEnabled(False)
+        try:
+            while self._messages_layout.count() > 1:
+                item = self._messages_layout.takeAt(0)
+                widget = item.widget()
+                if widget is not None:
+                    self._release_widget(widget)
+        finally:
+            self._messages_container.setUpdatesEnabled(True)
@@ -1,12 +1,18 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QDoubleSpinBox, QDialog, 
-                               QDialogButtonBox, QListWidget, QListWidgetItem,
+                               QDialogButtonBox, QListView,
                                QAbstractItemView, QGroupBox, QFormLayout,
-                               QComboBox, QSpinBox)
-from PySide6.QtCore import Qt, Signal
+                               QComboBox, QSpinBox, QInputDialog)
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSignalBlocker, QStringListModel, QModelIndex
 from typing import List, Tuple
 import numpy as np
 
+# Pre-bound formatters for the number display hot paths
+_FMT6 = "{:.6g}".format
+_FMT7 = "{:.7g}".format
+_FMT10 = "{:.10g}".format
+_FMT15 = "{:.15g}".format
+
 
 class ScientificDoubleSpinBox(QDoubleSpinBox):
     """SpinBox optimized for scientific values."""
@@ -18,12 +24,15 @@ class ScientificDoubleSpinBox(QDoubleSpinBox):
         self.setStepType(QDoubleSpinBox.AdaptiveDecimalStepType)
     
     def textFromValue(self, value):
-        return format(value, '.10g')
+        return _FMT10(value)
 
 
 class GenerateSeriesDialog(QDialog):
     """Dialog for generating a series of offset values."""
     
+    PREVIEW_DELAY_MS = 50  # Coalesce bursts of spin box edits into one preview update
+    SMALL_SERIES_MAX = 64  # Build linear series directly up to this many samples
+    
     def __init__(self, min_val: float = -1.0, max_val: float = 1.0, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Generate Number Series")
@@ -32,6 +41,14 @@ class GenerateSeriesDialog(QDialog):
         self._min_val = min_val
         self._max_val = max_val
         self._result: List[float] = []
+        self._cache_key = None  # (min, max, samples, type) of the cached series
+        self._cache_val = np.empty(0)
+        self._last_series = np.empty(0)  # Series shown by the latest preview
+        
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self._do_update_preview)
         
         layout = QVBoxLayout(self)
         
@@ -84,36 +101,65 @@ class GenerateSeriesDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
         
-        self._update_preview()
+        self._do_update_preview()
     
+    @Slot()
     def _reset_range(self) -> None:
         """Reset range to initial data range."""
-        self._min_spin.setValue(self._min_val)
-        self._max_spin.setValue(self._max_val)
+        with QSignalBlocker(self._min_spin), QSignalBlocker(self._max_spin):
+            self._min_spin.setValue(self._min_val)
+            self._max_spin.setValue(self._max_val)
+        self._update_preview()
     
-    def _generate_series(self) -> List[float]:
+    def _generate_series(self) -> np.ndarray:
         """Generate the series based on current settings."""
         min_v = self._min_spin.value()
         max_v = self._max_spin.value()
         n = self._samples_spin.value()
+        series_type = self._type_combo.currentText()
+        
+        key = (min_v, max_v, n, series_type)
+        if key == self._cache_key:
+            return self._cache_val
         
-        if self._type_combo.currentText() == "Linear":
-            return list(np.linspace(min_v, max_v, n))
-        return [min_v]
+        if series_type == "Linear":
+            if n <= self.SMALL_SERIES_MAX:
+                # Cheaper than np.linspace's setup for the usual handful of samples
+                series = min_v + np.arange(n, dtype=np.float64) * ((max_v - min_v) / (n - 1))
+                series[-1] = max_v
+            else:
+                series = np.linspace(min_v, max_v, n)
+        else:
+            series = np.array([min_v])
+        self._cache_key = key
+        self._cache_val = series
+        return series
     
+    @Slot()
     def _update_preview(self) -> None:
+        """Schedule a preview update."""
+        self._preview_timer.start()
+    
+    @Slot()
+    def _do_update_preview(self) -> None:
         """Update the preview label."""
+        self._preview_timer.stop()
         series = self._generate_series()
-        formatted = [format(v, '.6g') for v in series]
-        if len(formatted) > 8:
-            preview_text = ", ".join(formatted[:4]) + ", ..., " + ", ".join(formatted[-2:])
+        self._last_series = series
+        if len(series) > 8:
+            head = ", ".join(map(_FMT6, series[:4]))
+            tail = ", ".join(map(_FMT6, series[-2:]))
+            preview_text = f"{head}, ..., {tail}"
         else:
-            preview_text = ", ".join(formatted)
+            preview_text = ", ".join(map(_FMT6, series))
         self._preview_label.setText(f"Sample series: {preview_text}")
     
+    @Slot()
     def _on_generate(self) -> None:
         """Handle generate button click."""
-        self._result = self._generate_series()
+        if self._preview_timer.isActive():
+            self._do_update_preview()
+        self._result = self._last_series.tolist()
         self.accept()
     
     def get_result(self) -> List[float]:
@@ -125,10 +171,16 @@ class OffsetListWidget(QWidget):
     """Widget for managing a list of offset values."""
     
     offsets_changed = Signal(list)
+    refresh_requested = Signal()  # The owner recomputes the range and calls set_value_range
+    
+    INITIAL_CAPACITY = 16
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._value_range: Tuple[float, float] = (-1.0, 1.0)
+        # Source of truth for the offsets, grown by doubling; the list only displays them
+        self._values_buf = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._values_len = 0
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -141,12 +193,15 @@ class OffsetListWidget(QWidget):
         
         list_layout = QHBoxLayout()
         
-        self._list_widget = QListWidget()
-        self._list_widget.setSelectionMode(QAbstractItemView.SingleSelection)
-        self._list_widget.setMinimumHeight(150)
-        self._list_widget.setMaximumHeight(200)
-        self._list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
-        list_layout.addWidget(self._list_widget)
+        self._model = QStringListModel(self)
+        self._list_view = QListView()
+        self._list_view.setModel(self._model)
+        self._list_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._list_view.setMinimumHeight(150)
+        self._list_view.setMaximumHeight(200)
+        self._list_view.doubleClicked.connect(self._on_index_double_clicked)
+        list_layout.addWidget(self._list_view)
         
         btn_layout = QVBoxLayout()
         btn_layout.setSpacing(2)
@@ -178,7 +233,7 @@ class OffsetListWidget(QWidget):
         refresh_btn = QPushButton("↻")
         refresh_btn.setFixedSize(30, 30)
         refresh_btn.setToolTip("Refresh value range")
-        refresh_btn.clicked.connect(self._on_refresh_range)
+        refresh_btn.clicked.connect(self.refresh_requested)
         btn_layout.addWidget(refresh_btn)
         
         btn_layout.addStretch()
@@ -186,79 +241,98 @@ class OffsetListWidget(QWidget):
         
         layout.addLayout(list_layout)
         
-        self._add_item(0.0)
+        self._append_value(0.0)
+        self._last_emitted: Tuple[float, ...] = tuple(self.get_offsets())
     
     def set_value_range(self, min_val: float, max_val: float) -> None:
         """Set the valid value range for offsets."""
-        self._value_range = (min_val, max_val)
-        self._range_label.setText(f"Value Range: [{format(min_val, '.7g')}, {format(max_val, '.7g')}]")
+        value_range = (min_val, max_val)
+        if value_range == self._value_range:
+            return
+        self._value_range = value_range
+        self._range_label.setText(f"Value Range: [{_FMT7(min_val)}, {_FMT7(max_val)}]")
     
     def set_offsets(self, offsets: List[float]) -> None:
         """Set the offset values."""
-        self._list_widget.clear()
-        for offset in offsets:
-            self._add_item(offset)
+        self._set_values(offsets)
+        self._last_emitted = tuple(self.get_offsets())
     
     def get_offsets(self) -> List[float]:
         """Get current offset values."""
-        offsets = []
-        for i in range(self._list_widget.count()):
-            item = self._list_widget.item(i)
-            offsets.append(item.data(Qt.UserRole))
-        return offsets
+        return self._values.tolist()
     
-    def _add_item(self, value: float) -> None:
+    @property
+    def _values(self) -> np.ndarray:
+        """View of the offsets currently in use."""
+        return self._values_buf[:self._values_len]
+    
+    def _append_value(self, value: float) -> None:
         """Add a new offset item."""
-        item = QListWidgetItem(format(value, '.15g'))
-        item.setData(Qt.UserRole, value)
-        self._list_widget.addItem(item)
+        if self._values_len == self._values_buf.size:
+            self._values_buf = np.resize(self._values_buf, self._values_buf.size * 2)
+        self._values_buf[self._values_len] = value
+        self._values_len += 1
+        row = self._model.rowCount()
+        self._model.insertRows(row, 1)
+        self._model.setData(self._model.index(row), _FMT15(value))
+    
+    def _set_values(self, values) -> None:
+        """Replace all offsets, resetting the list model once."""
+        values = np.array(values, dtype=np.float64)
+        self._values_buf = values if values.size else np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._values_len = values.size
+        self._model.setStringList(np.char.mod("%.15g", self._values).tolist())
     
+    @Slot()
     def _on_add(self) -> None:
         """Add a new offset value at 0."""
-        self._add_item(0.0)
+        self._append_value(0.0)
         self._emit_change()
     
+    @Slot()
     def _on_remove(self) -> None:
         """Remove selected offset."""
-        current = self._list_widget.currentRow()
-        if current >= 0 and self._list_widget.count() > 1:
-            self._list_widget.takeItem(current)
+        current = self._list_view.currentIndex().row()
+        if current >= 0 and self._model.rowCount() > 1:
+            self._model.removeRows(current, 1)
+            self._values_buf[current:self._values_len - 1] = self._values_buf[current + 1:self._values_len]
+            self._values_len -= 1
             self._emit_change()
     
+    @Slot()
     def _on_generate_series(self) -> None:
         """Open generate series dialog."""
         dialog = GenerateSeriesDialog(self._value_range[0], self._value_range[1], self)
         if dialog.exec() == QDialog.Accepted:
-            series = dialog.get_result()
-            self._list_widget.clear()
-            for value in series:
-                self._add_item(value)
+            self._set_values(dialog.get_result())
             self._emit_change()
     
+    @Slot()
     def _on_clear(self) -> None:
         """Clear all offsets and add default 0."""
-        self._list_widget.clear()
-        self._add_item(0.0)
+        self._set_values([0.0])
         self._emit_change()
     
-    def _on_refresh_range(self) -> None:
-        """Request range refresh (parent should handle this)."""
-        pass
-    
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    @Slot(QModelIndex)
+    def _on_index_double_clicked(self, index: QModelIndex) -> None:
         """Handle double-click to edit value."""
-        from PySide6.QtWidgets import QInputDialog
-        current_value = item.data(Qt.UserRole)
+        row = index.row()
+        current_value = float(self._values[row])
         new_value, ok = QInputDialog.getDouble(
             self, "Edit Offset", "Offset value:",
             current_value, -1e30, 1e30, 10
         )
         if ok:
-            item.setText(format(new_value, '.15g'))
-            item.setData(Qt.UserRole, new_value)
+            self._model.setData(index, _FMT15(new_value))
+            self._values[row] = new_value
             self._emit_change()
     
     def _emit_change(self) -> None:
-        """Emit offsets changed signal."""
-        self.offsets_changed.emit(self.get_offsets())
+        """Emit offsets changed signal if the offsets differ from the last ones reported."""
+        offsets = self.get_offsets()
+        values = tuple(offsets)
+        if values == self._last_emitted:
+            return
+        self._last_emitted = values
+        self.offsets_changed.emit(offsets)
 
@@ -1,8 +1,11 @@
 from PySide6.QtWidgets import (QMainWindow, QSplitter, QTabWidget, QTextEdit,
                                QMenu, QToolButton, QFileDialog, QMessageBox, QToolBar,
-                               QDialog, QDialogButtonBox, QFormLayout, QDoubleSpinBox, QLabel)
-from PySide6.QtGui import QAction
-from PySide6.QtCore import Qt
+                               QDialog, QDialogButtonBox, QFormLayout, QDoubleSpinBox, QLabel,
+                               QLineEdit)
+from PySide6.QtGui import QAction, QDoubleValidator
+from PySide6.QtCore import Qt, QLocale
+from typing import Any, Optional
+import copy
 
 from views.vtk_widget import VTKWidget
 from views.pipeline_browser import PipelineBrowserWidget
@@ -14,7 +17,6 @@ from viewmodels.vtk_viewmodel import VTKViewModel
 from viewmodels.chat_viewmodel import ChatViewModel
 from viewmodels.time_series_manager import TimeSeriesManager
 from models.properties_context import PropertiesPanelContext
-import filters
 
 
 class ScalarRangeDialog(QDialog):
@@ -27,29 +29,37 @@ class ScalarRangeDialog(QDialog):
         
         layout = QFormLayout(self)
         
-        self.min_spinbox = QDoubleSpinBox()
-        self.min_spinbox.setRange(-1e10, 1e10)
-        self.min_spinbox.setValue(current_min)
-        self.min_spinbox.setDecimals(6)
-        self.min_spinbox.setSingleStep(0.1)
+        # C locale so the accepted text always parses with float(); 15 decimals so
+        # small .6g values such as 0.000123457 are not rejected as incomplete
+        validator = QDoubleValidator(-1e10, 1e10, 15, self)
+        validator.setLocale(QLocale.c())
         
-        self.max_spinbox = QDoubleSpinBox()
-        self.max_spinbox.setRange(-1e10, 1e10)
-        self.max_spinbox.setValue(current_max)
-        self.max_spinbox.setDecimals(6)
-        self.max_spinbox.setSingleStep(0.1)
+        self.min_edit = QLineEdit(f"{current_min:.6g}")
+        self.min_edit.setValidator(validator)
         
-        layout.addRow("Minimum value:", self.min_spinbox)
-        layout.addRow("Maximum value:", self.max_spinbox)
+        self.max_edit = QLineEdit(f"{current_max:.6g}")
+        self.max_edit.setValidator(validator)
+        
+        layout.addRow("Minimum value:", self.min_edit)
+        layout.addRow("Maximum value:", self.max_edit)
         
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addRow(buttons)
+        
+        self._ok_button = buttons.button(QDialogButtonBox.Ok)
+        self.min_edit.textChanged.connect(self._update_ok_enabled)
+        self.max_edit.textChanged.connect(self._update_ok_enabled)
+        self._update_ok_enabled()
+    
+    def _update_ok_enabled(self) -> None:
+        """Allow OK only while both fields hold a valid number."""
+        self._ok_button.setEnabled(self.min_edit.hasAcceptableInput() and self.max_edit.hasAcceptableInput())
     
     def get_values(self):
         """Get the entered min and max values."""
-        return self.min_spinbox.value(), self.max_spinbox.value()
+        return float(self.min_edit.text()), float(self.max_edit.text())
 
 
 class CameraViewDialog(QDialog):
@@ -128,12 +138,17 @@ class MainWindow(QMainWindow):
         self._vtk_vm = vtk_vm
         self._chat_vm = chat_vm
         self._time_manager = TimeSeriesManager(self)
+        # item_id -> (vtk_data, mtime, data arrays) for the properties panel
+        self._data_arrays_cache: dict[str, tuple[Any, int, list]] = {}
+        # What the properties panel was last built from; see _update_properties_panel
+        self._props_signature: Optional[tuple] = None
         
         self.setWindowTitle("Scientific Analysis Agent")
         self.resize(1400, 900)
         
         self._setup_menu_bar()
         self._setup_toolbar()
+        self._toolbars = self.findChildren(QToolBar)
         self._setup_main_layout()
         self._connect_signals()
         self._initialize()
@@ -161,10 +176,9 @@ class MainWindow(QMainWindow):
         """Populate filters menu from registry."""
         for filter_type, display_name in self._pipeline_vm.get_available_filters():
             action = QAction(display_name, self)
-            action.triggered.connect(
-                lambda checked=False, ft=filter_type: self._on_apply_filter(ft)
-            )
+            action.setData(filter_type)
             menu.addAction(action)
+        menu.triggered.connect(self._on_filter_action_triggered)
     
     def _setup_toolbar(self) -> None:
         """Setup the toolbar."""
@@ -179,13 +193,13 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         
         action_xy = toolbar.addAction("XY Plane")
-        action_xy.triggered.connect(lambda: self._vtk_vm.set_view_plane("xy"))
+        action_xy.triggered.connect(self._set_view_xy)
         
         action_yz = toolbar.addAction("YZ Plane")
-        action_yz.triggered.connect(lambda: self._vtk_vm.set_view_plane("yz"))
+        action_yz.triggered.connect(self._set_view_yz)
         
         action_xz = toolbar.addAction("XZ Plane")
-        action_xz.triggered.connect(lambda: self._vtk_vm.set_view_plane("xz"))
+        action_xz.triggered.connect(self._set_view_xz)
         
         toolbar.addSeparator()
         
@@ -215,9 +229,8 @@ class MainWindow(QMainWindow):
         bg_menu = QMenu(self)
         for name, c1, c2 in self._vtk_vm.BACKGROUND_PRESETS:
             action = bg_menu.addAction(name)
-            action.triggered.connect(
-                lambda checked=False, col1=c1, col2=c2: self._vtk_vm.set_background(col1, col2)
-            )
+            action.setData((c1, c2))
+        bg_menu.triggered.connect(self._on_background_action_triggered)
         
         bg_btn.setMenu(bg_menu)
         toolbar.addWidget(bg_btn)
@@ -235,9 +248,8 @@ class MainWindow(QMainWindow):
         rep_menu = QMenu(self)
         for style in self._vtk_vm.REPRESENTATION_STYLES:
             action = rep_menu.addAction(style)
-            action.triggered.connect(
-                lambda checked=False, s=style: self._on_representation_changed(s)
-            )
+            action.setData(style)
+        rep_menu.triggered.connect(self._on_representation_action_triggered)
         
         rep_btn.setMenu(rep_menu)
         toolbar.addWidget(rep_btn)
@@ -267,6 +279,8 @@ class MainWindow(QMainWindow):
         
         self._info_page = QTextEdit()
         self._info_page.setReadOnly(True)
+        self._info_page.setUndoRedoEnabled(False)
+        self._info_text = ""
         self._details_tabs.addTab(self._info_page, "Information")
         
         left_sidebar.addWidget(self._details_tabs)
@@ -289,16 +303,19 @@ class MainWindow(QMainWindow):
     def _connect_signals(self) -> None:
         """Connect all signals between views and viewmodels."""
         self._pipeline_vm.item_added.connect(self._on_item_added)
-        self._pipeline_vm.item_removed.connect(self._on_item_removed)
+        self._pipeline_vm.items_removed.connect(self._on_items_removed)
+        self._pipeline_vm.items_batch_changed.connect(self._on_items_batch_changed)
         self._pipeline_vm.item_updated.connect(self._on_item_updated)
         self._pipeline_vm.selection_changed.connect(self._on_selection_changed)
         self._pipeline_vm.time_series_loaded.connect(self._on_time_series_loaded)
+        self._pipeline_vm.file_loaded.connect(self._on_file_loaded)
+        self._pipeline_vm.time_step_changed.connect(self._on_item_time_step_changed)
         
         self._pipeline_browser.item_selected.connect(self._on_browser_selection)
         self._pipeline_browser.item_visibility_changed.connect(self._on_visibility_changed)
         self._pipeline_browser.item_delete_requested.connect(self._on_delete_requested)
         
-        self._properties_panel.apply_filter_requested.connect(self._pipeline_vm.commit_filter)
+        self._properties_panel.apply_filter_requested.connect(self._pipeline_vm.commit_filter_async)
         self._properties_panel.delete_requested.connect(self._on_delete_requested)
         self._properties_panel.opacity_changed.connect(self._on_opacity_changed)
         self._properties_panel.point_size_changed.connect(self._pipeline_vm.set_point_size)
@@ -311,22 +328,15 @@ class MainWindow(QMainWindow):
         self._chat_panel.message_sent.connect(self._chat_vm.send_user_message)
         self._chat_panel.new_conversation_requested.connect(self._chat_vm.start_new_conversation)
         self._chat_panel.cancel_requested.connect(self._chat_vm.stop_generation)
-        self._chat_vm.message_added.connect(
-            lambda msg: self._chat_panel.append_message(msg.sender, msg.content)
-        )
-        self._chat_vm.streaming_started.connect(self._chat_panel.start_streaming)
+        self._chat_vm.message_added.connect(self._on_chat_message_added)
+        self._chat_vm.streaming_started.connect(self._on_streaming_started)
         self._chat_vm.streaming_token.connect(self._chat_panel.update_streaming)
-        self._chat_vm.streaming_finished.connect(self._chat_panel.finish_streaming)
+        self._chat_vm.streaming_finished.connect(self._on_streaming_finished)
         self._chat_vm.tool_activity.connect(self._chat_panel.add_tool_activity)
-        self._chat_vm.input_requested.connect(
-            lambda desc, fields: self._chat_panel.show_input_form(desc, fields, self._chat_vm)
-        )
-        self._chat_vm.render_requested.connect(self._vtk_widget.render)
+        self._chat_vm.input_requested.connect(self._on_input_requested)
+        self._chat_vm.render_requested.connect(self._vtk_vm.request_render)
         self._chat_vm.conversation_cleared.connect(self._chat_panel.clear_display)
         
-        self._chat_vm.streaming_started.connect(self._on_ai_started)
-        self._chat_vm.streaming_finished.connect(self._on_ai_finished)
-        
         self._vtk_vm.render_requested.connect(self._vtk_widget.render)
         self._vtk_vm.actor_added.connect(self._vtk_widget.add_actor)
         self._vtk_vm.actor_removed.connect(self._vtk_widget.remove_actor)
@@ -337,15 +347,24 @@ class MainWindow(QMainWindow):
         self._vtk_vm.view_plane_requested.connect(self._vtk_widget.set_view_plane)
         self._vtk_vm.plane_preview_requested.connect(self._vtk_widget.update_plane_preview)
         self._vtk_vm.plane_preview_hide_requested.connect(self._vtk_widget.hide_plane_preview)
-        self._vtk_vm.camera_query_requested.connect(
-            lambda: self._vtk_vm.notify_camera_state(self._vtk_widget.get_camera_state())
-        )
+        self._vtk_vm.camera_query_requested.connect(self._on_camera_query_requested)
+        self._vtk_vm.set_camera_state_provider(self._vtk_widget.get_camera_state)
         self._vtk_vm.camera_apply_requested.connect(self._vtk_widget.apply_camera_state)
         self._vtk_vm.scalar_bar_update_requested.connect(self._vtk_widget.update_scalar_bar)
         self._vtk_vm.scalar_bar_hide_requested.connect(self._vtk_widget.hide_scalar_bar)
         self._vtk_vm.legend_settings_changed.connect(self._vtk_widget.apply_legend_settings)
         
-        self._time_manager.time_changed.connect(self._on_time_step_changed)
+        # Queued so loading and rendering a step never runs inside the playback timer tick
+        self._time_manager.time_changed.connect(
+            self._on_time_step_changed, Qt.ConnectionType.QueuedConnection
+        )
+        self._time_manager.animation_state_changed.connect(self._on_animation_state_changed)
+        self._time_manager.prefetch_requested.connect(self._pipeline_vm.prefetch_time_steps)
+    
+    def closeEvent(self, event) -> None:
+        """Stop background pipeline work before the window closes."""
+        self._pipeline_vm.shutdown()
+        super().closeEvent(event)
     
     def _initialize(self) -> None:
         """Initialize the application state."""
@@ -362,11 +381,12 @@ class MainWindow(QMainWindow):
         if not file_names:
             return
         
-        if len(file_names) > 1:
-            item = self._pipeline_vm.load_time_series(file_names)
-        else:
-            item = self._pipeline_vm.load_file(file_names[0])
-        
+        self._set_ui_enabled(False)
+        self._pipeline_vm.load_files_async(file_names)
+    
+    def _on_file_loaded(self, item) -> None:
+        """Show a file loaded in the background and re-enable the UI."""
+        self._set_ui_enabled(True)
         if item:
             self._vtk_vm.add_actor(item.actor)
             self._vtk_vm.reset_camera()
@@ -385,6 +405,19 @@ class MainWindow(QMainWindow):
             self._vtk_vm.request_render()
             self._pipeline_vm.select_item(item.id)
     
+    def _on_filter_action_triggered(self, action: QAction) -> None:
+        """Apply the filter stored on a Filters menu action."""
+        self._on_apply_filter(action.data())
+    
+    def _on_background_action_triggered(self, action: QAction) -> None:
+        """Apply the background colors stored on a Background menu action."""
+        c1, c2 = action.data()
+        self._vtk_vm.set_background(c1, c2)
+    
+    def _on_representation_action_triggered(self, action: QAction) -> None:
+        """Apply the style stored on a Representation menu action."""
+        self._on_representation_changed(action.data())
+    
     def _on_representation_changed(self, style: str) -> None:
         """Handle representation style change."""
         selected = self._pipeline_vm.selected_item
@@ -400,12 +433,27 @@ class MainWindow(QMainWindow):
             self._vtk_vm.add_actor(item.actor)
             self._vtk_vm.request_render()
     
-    def _on_item_removed(self, item_id: str) -> None:
-        """Handle item removed from pipeline."""
-        item = self._pipeline_vm.items.get(item_id)
-        if item and item.actor:
-            self._vtk_vm.remove_actor(item.actor)
-        self._pipeline_browser.remove_item(item_id)
+    def _on_items_batch_changed(self, added: list, updated: list) -> None:
+        """Handle a batch of added and updated items with one tree rebuild."""
+        self._pipeline_browser.add_items(added)
+        for item in added:
+            if item.actor:
+                self._vtk_vm.add_actor(item.actor)
+        
+        selected = self._pipeline_vm.selected_item
+        for item in updated:
+            self._pipeline_browser.update_item(item)
+            if selected and item.id == selected.id:
+                self._update_properties_panel(item)
+        self._vtk_vm.request_render()
+    
+    def _on_items_removed(self, items: list) -> None:
+        """Handle a subtree removed from pipeline."""
+        for item in items:
+            self._data_arrays_cache.pop(item.id, None)
+            if item.actor:
+                self._vtk_vm.remove_actor(item.actor)
+        self._pipeline_browser.remove_items([item.id for item in items])
         self._vtk_vm.hide_plane_preview()
     
     def _on_item_updated(self, item) -> None:
@@ -420,11 +468,12 @@ class MainWindow(QMainWindow):
         if item:
             self._pipeline_browser.select_item(item.id)
             self._update_properties_panel(item)
-            self._info_page.setPlainText(item.get_info_string())
+            self._set_info_text(item.get_info_string())
             self._update_time_animation_widget(item)
         else:
+            self._props_signature = None
             self._properties_panel.set_item(None)
-            self._info_page.setPlainText("")
+            self._set_info_text("")
             self._vtk_vm.hide_plane_preview()
             self._vtk_vm.hide_scalar_bar()
             self._time_manager.set_item(None)
@@ -436,16 +485,14 @@ class MainWindow(QMainWindow):
     
     def _on_visibility_changed(self, item_id: str, visible: bool) -> None:
         """Handle visibility toggle."""
-        self._pipeline_vm.set_visibility(item_id, visible)
+        # Before set_visibility(), which toggles the actor and would make this a no-op
         item = self._pipeline_vm.items.get(item_id)
         if item and item.actor:
             self._vtk_vm.set_actor_visibility(item.actor, visible)
+        self._pipeline_vm.set_visibility(item_id, visible)
     
     def _on_delete_requested(self, item_id: str) -> None:
         """Handle delete request."""
-        item = self._pipeline_vm.items.get(item_id)
-        if item and item.actor:
-            self._vtk_vm.remove_actor(item.actor)
         self._pipeline_vm.delete_item(item_id)
         self._vtk_vm.hide_plane_preview()
     
@@ -472,34 +519,63 @@ class MainWindow(QMainWindow):
         self._pipeline_vm.update_filter_params(item_id, params)
         
         item = self._pipeline_vm.items.get(item_id)
-        if item and "filter" in item.item_type:
+        if item and self._props_signature and self._props_signature[0] == item_id:
+            # The panel made this edit, so it already shows these parameters
+            self._props_signature = self._props_signature[:-1] + (copy.deepcopy(item.filter_params),)
+        if item and item.is_filter:
             self._update_plane_preview_visibility(item)
     
     
     def _update_properties_panel(self, item) -> None:
         """Update properties panel for item."""
         if not item:
+            self._props_signature = None
             self._properties_panel.set_item(None)
             self._vtk_vm.hide_scalar_bar()
             self._vtk_vm.hide_plane_preview()
             return
         
-        ctx = PropertiesPanelContext.from_item(item, self._vtk_vm)
+        ctx = PropertiesPanelContext.from_item(item, self._vtk_vm, self._cached_data_arrays(item))
         
         parent_bounds = None
-        if "filter" in item.item_type:
+        if item.is_filter:
             parent = self._pipeline_vm.get_parent_item(item.id)
             if parent and parent.vtk_data:
-                parent_bounds = parent.vtk_data.GetBounds()
+                parent_bounds = parent.bounds
         
-        self._properties_panel.set_item(
-            item, ctx.style, ctx.data_arrays, ctx.current_array, ctx.current_component,
-            ctx.scalar_visible, parent_bounds
+        # Rebuild only when something the panel's layout depends on changed; otherwise
+        # just sync the styling values so in-progress edits keep their widgets
+        signature = (
+            item.id, ctx.style, tuple(ctx.data_arrays), ctx.current_array, ctx.current_component,
+            ctx.scalar_visible, item.visible, parent_bounds, item.filter_params
         )
+        if signature == self._props_signature:
+            self._properties_panel.refresh_values()
+        else:
+            self._props_signature = signature[:-1] + (copy.deepcopy(item.filter_params),)
+            self._properties_panel.set_item(
+                item, ctx.style, ctx.data_arrays, ctx.current_array, ctx.current_component,
+                ctx.scalar_visible, parent_bounds
+            )
         
         self._update_scalar_bar_visibility(item, ctx.scalar_visible)
         self._update_plane_preview_visibility(item)
     
+    def _cached_data_arrays(self, item) -> list:
+        """Get the item's data arrays, rescanning only when its data object changed."""
+        data = item.vtk_data
+        if data is None:
+            return []
+        
+        mtime = data.GetMTime()
+        cached = self._data_arrays_cache.get(item.id)
+        if cached and cached[0] is data and cached[1] == mtime:
+            return cached[2]
+        
+        data_arrays = self._vtk_vm.get_data_arrays(data)
+        self._data_arrays_cache[item.id] = (data, mtime, data_arrays)
+        return data_arrays
+    
     def _update_scalar_bar_visibility(self, item, scalar_visible: bool) -> None:
         """Update scalar bar based on item state."""
         if item.actor and scalar_visible and item.visible:
@@ -509,7 +585,7 @@ class MainWindow(QMainWindow):
     
     def _update_plane_preview_visibility(self, item) -> None:
         """Update plane preview based on filter's plane preview params."""
-        if "filter" not in item.item_type:
+        if not item.is_filter:
             self._vtk_vm.hide_plane_preview()
             return
         
@@ -527,7 +603,7 @@ class MainWindow(QMainWindow):
         parent = self._pipeline_vm.get_parent_item(item.id)
         
         if show_preview and parent and parent.vtk_data:
-            bounds = parent.vtk_data.GetBounds()
+            bounds = parent.bounds
             self._vtk_vm.show_plane_preview(origin, normal, bounds)
         else:
             self._vtk_vm.hide_plane_preview()
@@ -539,6 +615,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select an item with scalar data.")
             return
         
+        self._pipeline_vm.detach_placeholder(selected.id)
         if self._vtk_vm.fit_scalar_range(selected.actor):
             self._vtk_vm.update_scalar_bar(selected.actor)
             self._vtk_vm.request_render()
@@ -552,6 +629,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select an item with scalar data.")
             return
         
+        self._pipeline_vm.detach_placeholder(selected.id)
         mapper = selected.actor.GetMapper()
         if not mapper or not mapper.GetScalarVisibility():
             QMessageBox.warning(self, "Warning", "Selected item has no scalar data.")
@@ -579,11 +657,27 @@ class MainWindow(QMainWindow):
         state = self._vtk_widget.get_camera_state()
         
         dialog = CameraViewDialog(self, state)
-        dialog.apply_requested = lambda s: self._vtk_vm.apply_camera_state(s)
+        dialog.apply_requested = self._vtk_vm.apply_camera_state
         
         if dialog.exec() == QDialog.Accepted:
             self._vtk_vm.apply_camera_state(dialog.get_state())
     
+    def _set_view_xy(self) -> None:
+        """Look at the XY plane."""
+        self._vtk_vm.set_view_plane("xy")
+    
+    def _set_view_yz(self) -> None:
+        """Look at the YZ plane."""
+        self._vtk_vm.set_view_plane("yz")
+    
+    def _set_view_xz(self) -> None:
+        """Look at the XZ plane."""
+        self._vtk_vm.set_view_plane("xz")
+    
+    def _on_camera_query_requested(self) -> None:
+        """Report the widget's camera state back to the viewmodel."""
+        self._vtk_vm.notify_camera_state(self._vtk_widget.get_camera_state())
+    
     def _on_time_series_loaded(self, item) -> None:
         """Handle time series loaded."""
         self._time_manager.set_item(item)
@@ -595,12 +689,37 @@ class MainWindow(QMainWindow):
     
     def _on_time_step_changed(self, item_id: str, time_index: int) -> None:
         """Handle time step change from time manager."""
-        self._pipeline_vm.update_time_step(item_id, time_index)
-        self._vtk_vm.request_render()
+        is_playing = self._time_manager.is_playing
+        self._pipeline_vm.update_time_step(
+            item_id, time_index, is_scrubbing=is_playing, loop=self._time_manager.loop_enabled,
+            direction=self._time_manager.prefetch_direction
+        )
+        if is_playing:
+            return
         
         item = self._pipeline_vm.items.get(item_id)
         if item:
-            self._info_page.setPlainText(item.get_info_string())
+            self._set_info_text(item.get_info_string())
+    
+    def _on_item_time_step_changed(self, item) -> None:
+        """Render the new time step of an item."""
+        self._vtk_vm.request_render()
+    
+    def _on_animation_state_changed(self, is_playing: bool, is_forward: bool) -> None:
+        """Refresh views skipped during playback once it stops."""
+        item = self._time_manager.current_item
+        if is_playing or not item:
+            return
+        
+        self._pipeline_vm.refresh_time_step_display(item.id)
+        self._pipeline_vm.notify_item_updated(item.id)
+        self._set_info_text(item.get_info_string())
+    
+    def _set_info_text(self, text: str) -> None:
+        """Show text on the information page, skipping the relayout if unchanged."""
+        if text != self._info_text:
+            self._info_text = text
+            self._info_page.setPlainText(text)
     
     def _update_time_animation_widget(self, item) -> None:
         """Update time animation widget for selected item."""
@@ -615,12 +734,22 @@ class MainWindow(QMainWindow):
             self._time_manager.set_item(None)
             self._time_animation_widget.update_for_item(False, 0, 0)
     
-    def _on_ai_started(self) -> None:
+    def _on_chat_message_added(self, msg) -> None:
+        """Show a chat message added by the viewmodel."""
+        self._chat_panel.append_message(msg.sender, msg.content)
+    
+    def _on_input_requested(self, description: str, fields: list) -> None:
+        """Show an input form requested by the agent."""
+        self._chat_panel.show_input_form(description, fields, self._chat_vm)
+    
+    def _on_streaming_started(self) -> None:
         """Handle AI starting to process/reflect."""
+        self._chat_panel.start_streaming()
         self._set_ui_enabled(False)
     
-    def _on_ai_finished(self) -> None:
+    def _on_streaming_finished(self) -> None:
         """Handle AI finishing processing."""
+        self._chat_panel.finish_streaming()
         self._set_ui_enabled(True)
     
     def _set_ui_enabled(self, enabled: bool) -> None:
@@ -628,7 +757,7 @@ class MainWindow(QMainWindow):
         self.menuBar().setEnabled(enabled)
         
         # Disable all toolbars
-        for toolbar in self.findChildren(QToolBar):
+        for toolbar in self._toolbars:
             toolbar.setEnabled(enabled)
             
         self._pipeline_browser.setEnabled(enabled)
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu
-from PySide6.QtCore import Qt, Signal
-from typing import Optional, Dict
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
+from typing import Optional, Dict, List
 from models.pipeline_item import PipelineItem
 
 
@@ -25,55 +25,75 @@ class PipelineBrowserWidget(QTreeWidget):
     
     def add_item(self, pipeline_item: PipelineItem) -> QTreeWidgetItem:
         """Add a pipeline item and rebuild tree to maintain correct order."""
-        self._all_items[pipeline_item.id] = pipeline_item
-        self._rebuild_tree()
+        self.add_items([pipeline_item])
         return self._item_map.get(pipeline_item.id)
     
+    def add_items(self, pipeline_items: list[PipelineItem]) -> None:
+        """Add several pipeline items with a single tree rebuild."""
+        if not pipeline_items:
+            return
+        for pipeline_item in pipeline_items:
+            self._all_items[pipeline_item.id] = pipeline_item
+        self._rebuild_tree()
+    
     def _rebuild_tree(self) -> None:
         """Rebuild entire tree based on branching logic."""
         selected_id = self.get_selected_item_id()
         
-        self.blockSignals(True)
-        self.clear()
-        self._item_map.clear()
+        children_by_parent: Dict[Optional[str], List[PipelineItem]] = {}
+        for item in self._all_items.values():
+            children_by_parent.setdefault(item.parent_id or None, []).append(item)
         
-        roots = [item for item in self._all_items.values() if not item.parent_id]
-        for root in roots:
-            self._add_item_recursive(root, None)
+        # Build the new tree detached from the widget, then insert it in one call
+        self._item_map.clear()
+        top_level_items: List[QTreeWidgetItem] = []
+        for root in children_by_parent.get(None, []):
+            self._add_item_recursive(root, None, children_by_parent, top_level_items)
         
-        self.blockSignals(False)
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self):
+                self.clear()
+                self.addTopLevelItems(top_level_items)
+                self.expandAll()
+        finally:
+            self.setUpdatesEnabled(True)
         
         if selected_id and selected_id in self._item_map:
             self.setCurrentItem(self._item_map[selected_id])
     
-    def _add_item_recursive(self, item: PipelineItem, ui_parent: Optional[QTreeWidgetItem]) -> None:
+    def _add_item_recursive(self, item: PipelineItem, ui_parent: Optional[QTreeWidgetItem],
+                            children_by_parent: Dict[Optional[str], List[PipelineItem]],
+                            top_level_items: List[QTreeWidgetItem]) -> None:
         """Recursively add item. If only one child, keep same level."""
-        if ui_parent:
-            tree_item = QTreeWidgetItem(ui_parent)
-            ui_parent.setExpanded(True)
-        else:
-            tree_item = QTreeWidgetItem(self)
-        
+        tree_item = QTreeWidgetItem()
         tree_item.setText(0, item.name)
         tree_item.setCheckState(0, Qt.Checked if item.visible else Qt.Unchecked)
         tree_item.setData(0, Qt.UserRole, item.id)
         self._item_map[item.id] = tree_item
         
-        children = [child for child in self._all_items.values() if child.parent_id == item.id]
+        if ui_parent:
+            ui_parent.addChild(tree_item)
+        else:
+            top_level_items.append(tree_item)
+        
+        children = children_by_parent.get(item.id, [])
         
         if len(children) == 1:
-            self._add_item_recursive(children[0], ui_parent)
+            self._add_item_recursive(children[0], ui_parent, children_by_parent, top_level_items)
         else:
             for child in children:
-                self._add_item_recursive(child, tree_item)
+                self._add_item_recursive(child, tree_item, children_by_parent, top_level_items)
     
     def remove_item(self, item_id: str) -> None:
         """Remove an item from the tree and rebuild if needed."""
-        if item_id not in self._all_items:
-            return
-        
-        del self._all_items[item_id]
-        self._rebuild_tree()
+        self.remove_items([item_id])
+    
+    def remove_items(self, item_ids: list[str]) -> None:
+        """Remove several items with a single tree rebuild."""
+        removed = [self._all_items.pop(item_id, None) for item_id in item_ids]
+        if any(removed):
+            self._rebuild_tree()
     
     def update_item(self, pipeline_item: PipelineItem) -> None:
         """Update tree item display."""
@@ -81,17 +101,15 @@ class PipelineBrowserWidget(QTreeWidget):
         tree_item = self._item_map.get(pipeline_item.id)
         if tree_item:
             tree_item.setText(0, pipeline_item.name)
-            self.blockSignals(True)
-            tree_item.setCheckState(0, Qt.Checked if pipeline_item.visible else Qt.Unchecked)
-            self.blockSignals(False)
+            with QSignalBlocker(self):
+                tree_item.setCheckState(0, Qt.Checked if pipeline_item.visible else Qt.Unchecked)
     
     def select_item(self, item_id: str) -> None:
         """Select an item in the tree without emitting signals."""
         tree_item = self._item_map.get(item_id)
         if tree_item:
-            self.blockSignals(True)
-            self.setCurrentItem(tree_item)
-            self.blockSignals(False)
+            with QSignalBlocker(self):
+                self.setCurrentItem(tree_item)
     
     def get_selected_item_id(self) -> Optional[str]:
         """Get the ID of the currently selected item."""
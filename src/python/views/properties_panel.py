@@ -2,7 +2,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, QGroupBox,
                                QFormLayout, QHBoxLayout, QLabel, QPushButton,
                                QSlider, QSpinBox, QComboBox, QCheckBox,
                                QDoubleSpinBox, QColorDialog)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
 from PySide6.QtGui import QColor
 from typing import Optional, List, Tuple, TYPE_CHECKING
 from models.pipeline_item import PipelineItem
@@ -35,6 +35,9 @@ class PropertiesPanel(QWidget):
         self._render_service: Optional["VTKRenderService"] = None
         self._filter_widget: Optional[QWidget] = None
         self._legend_settings: dict = DEFAULT_LEGEND_SETTINGS.copy()
+        # Styling controls that refresh_values() can update in place
+        self._opacity_controls: tuple = ()
+        self._style_value_control: Optional[tuple] = None  # (spin box, getter for the actor value)
         
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -114,6 +117,22 @@ class PropertiesPanel(QWidget):
         self._parent_bounds = parent_bounds
         self._rebuild_ui(current_array, current_component, scalar_visible)
     
+    def refresh_values(self) -> None:
+        """Update the styling controls from the current actor without rebuilding the panel."""
+        item = self._current_item
+        if not item or not item.actor:
+            return
+        
+        opacity = int(item.actor.GetProperty().GetOpacity() * 100)
+        for control in self._opacity_controls:
+            with QSignalBlocker(control):
+                control.setValue(opacity)
+        
+        if self._style_value_control:
+            spin, get_value = self._style_value_control
+            with QSignalBlocker(spin):
+                spin.setValue(get_value())
+    
     def _clear_layout(self) -> None:
         """Clear all widgets from the layout."""
         while self._layout.count():
@@ -126,6 +145,8 @@ class PropertiesPanel(QWidget):
         """Rebuild the properties UI for current item."""
         self._clear_layout()
         self._filter_widget = None
+        self._opacity_controls = ()
+        self._style_value_control = None
         
         if not self._current_item:
             self._apply_btn.setEnabled(False)
@@ -141,7 +162,7 @@ class PropertiesPanel(QWidget):
             self._layout.addWidget(QLabel("No styling properties available for this source."))
             return
         
-        self._apply_btn.setEnabled("filter" in item.item_type)
+        self._apply_btn.setEnabled(item.is_filter)
         self._delete_btn.setEnabled(True)
         
         if self._data_arrays:
@@ -153,7 +174,7 @@ class PropertiesPanel(QWidget):
             legend_enabled = scalar_visible and item.visible
             self._add_legend_section(legend_enabled)
         
-        if "filter" in item.item_type:
+        if item.is_filter:
             self._add_filter_params_section(item)
         
         self._layout.addStretch()
@@ -326,6 +347,7 @@ class PropertiesPanel(QWidget):
         
         slider.valueChanged.connect(update_opacity)
         spin.valueChanged.connect(update_opacity)
+        self._opacity_controls = (slider, spin)
         reset_btn.clicked.connect(lambda: update_opacity(100))
         
         row.addWidget(slider)
@@ -338,11 +360,13 @@ class PropertiesPanel(QWidget):
         if not self._current_item or not self._current_item.actor:
             return
         
-        current_size = self._current_item.actor.GetProperty().GetPointSize()
+        prop = self._current_item.actor.GetProperty()
+        current_size = prop.GetPointSize()
         
         row = QHBoxLayout()
         spin = ScientificDoubleSpinBox()
         spin.setValue(current_size)
+        self._style_value_control = (spin, prop.GetPointSize)
         
         reset_btn = QPushButton("Reset")
         reset_btn.setFixedWidth(50)
@@ -363,11 +387,13 @@ class PropertiesPanel(QWidget):
         if not self._current_item or not self._current_item.actor:
             return
         
-        current_width = self._current_item.actor.GetProperty().GetLineWidth()
+        prop = self._current_item.actor.GetProperty()
+        current_width = prop.GetLineWidth()
         
         row = QHBoxLayout()
         spin = ScientificDoubleSpinBox()
         spin.setValue(current_width)
+        self._style_value_control = (spin, prop.GetLineWidth)
         
         reset_btn = QPushButton("Reset")
         reset_btn.setFixedWidth(50)
@@ -394,6 +420,8 @@ class PropertiesPanel(QWidget):
         row = QHBoxLayout()
         spin = ScientificDoubleSpinBox()
         spin.setValue(current_scale)
+        if hasattr(mapper, "GetScaleFactor"):
+            self._style_value_control = (spin, mapper.GetScaleFactor)
         
         reset_btn = QPushButton("Reset")
         reset_btn.setFixedWidth(50)
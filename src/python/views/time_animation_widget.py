@@ -93,6 +93,10 @@ class TimeAnimationWidget(QWidget):
         self._label_max = QLabel("max is 0")
         layout.addWidget(self._label_max)
         
+        self._label_buffering = QLabel("Buffering...")
+        self._label_buffering.setVisible(False)
+        layout.addWidget(self._label_buffering)
+        
         layout.addStretch()
     
     def _connect_signals(self) -> None:
@@ -110,6 +114,7 @@ class TimeAnimationWidget(QWidget):
         
         self._time_manager.time_changed.connect(self._on_time_changed)
         self._time_manager.animation_state_changed.connect(self._on_animation_state_changed)
+        self._time_manager.buffering_changed.connect(self._label_buffering.setVisible)
     
     def _on_play_forward_clicked(self) -> None:
         """Handle play forward button click."""